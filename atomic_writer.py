@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+원자적 파일 쓰기 모듈
+README, 프로필 README, Jekyll 포스트, 저장소 정리 계획 등 모든 출력 파일이 함께 사용합니다.
+
+- 같은 디렉토리의 임시 파일에 쓴 뒤 rename으로 교체하므로
+  실행이 중간에 끊겨도 반쯤 쓰인 파일이 남지 않음
+- 여러 파일을 한 묶음(batch)으로 쓰고, 디렉토리 fsync는 묶음마다 한 번만 수행
+- fsync 정책을 선택 가능 (BLOG_FSYNC_POLICY 환경 변수)
+  - none: fsync 없음 (프로세스 중단에는 안전, 전원 장애에는 보장 없음)
+  - batch: 임시 파일마다 fsync하고, 교체는 commit()에서 한꺼번에 한 뒤
+    디렉토리마다 fsync 한 번 (기본값)
+  - always: 파일마다 fsync 후 바로 교체하고 디렉토리도 바로 fsync
+  파일이 하나뿐인 묶음에서는 batch와 always의 비용이 같습니다.
+"""
+
+import logging
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+FSYNC_NONE = "none"
+FSYNC_BATCH = "batch"
+FSYNC_ALWAYS = "always"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_BATCH, FSYNC_ALWAYS)
+FSYNC_POLICY = os.environ.get("BLOG_FSYNC_POLICY", FSYNC_BATCH)
+
+# mkstemp는 0600으로 파일을 만들므로 새 파일에는 umask를 반영한 기본 권한을 줌
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+DEFAULT_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _fsync_directory(directory: Path) -> None:
+    """디렉토리 항목(rename 결과)을 디스크에 기록합니다. (Windows는 지원하지 않음)"""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning(f"디렉토리 fsync 실패: {directory}: {e}")
+
+
+class AtomicWriter:
+    """
+    여러 파일을 원자적으로 쓰는 묶음 단위 작성기
+
+    with 블록이 정상 종료되면 commit()으로 묶음을 확정하고,
+    예외가 나면 abort()로 아직 교체하지 않은 임시 파일을 지웁니다.
+    write()는 여러 스레드에서 동시에 호출해도 됩니다.
+
+    batch 정책에서는 commit() 전까지 대상 파일이 바뀌지 않으므로
+    묶음 안의 파일들(예: 포스트와 포스트 목록)이 함께 반영됩니다.
+
+    Args:
+        fsync: fsync 정책 (none/batch/always, None이면 FSYNC_POLICY)
+    """
+
+    def __init__(self, fsync: Optional[str] = None):
+        self.fsync = fsync or FSYNC_POLICY
+        if self.fsync not in FSYNC_POLICIES:
+            raise ValueError(f"알 수 없는 fsync 정책: {self.fsync}")
+        # 대상 경로 → 아직 교체하지 않은 임시 파일 경로
+        self._pending: Dict[Path, str] = {}
+        self._directories: Set[Path] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "AtomicWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def write(self, path: Union[str, Path], data: Union[str, bytes]) -> None:
+        """
+        파일 내용을 같은 디렉토리의 임시 파일에 씁니다.
+
+        Args:
+            path: 대상 파일 경로
+            data: 파일 내용 (문자열은 UTF-8로 저장)
+        """
+        path = Path(path)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = DEFAULT_FILE_MODE
+
+        fd, temp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                if self.fsync != FSYNC_NONE:
+                    # 호출한 스레드에서 이 파일만 디스크에 내림 (쓰기 스레드 풀에서 병렬)
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.chmod(temp_name, mode)
+            if self.fsync != FSYNC_BATCH:
+                os.replace(temp_name, path)
+                if self.fsync == FSYNC_ALWAYS:
+                    _fsync_directory(path.parent)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
+        if self.fsync != FSYNC_BATCH:
+            return
+        with self._lock:
+            self._directories.add(path.parent)
+            # 같은 파일을 다시 쓰면 마지막 내용만 남김
+            previous = self._pending.pop(path, None)
+            self._pending[path] = temp_name
+        if previous:
+            os.unlink(previous)
+
+    def commit(self) -> None:
+        """
+        묶음을 확정합니다.
+        batch 정책이면 이미 fsync한 임시 파일들을 교체한 뒤
+        파일이 있는 디렉토리마다 fsync를 한 번씩 합니다.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            directories, self._directories = self._directories, set()
+
+        for path, temp_name in pending.items():
+            os.replace(temp_name, path)
+        for directory in directories:
+            _fsync_directory(directory)
+
+    def abort(self) -> None:
+        """아직 교체하지 않은 임시 파일을 모두 지웁니다."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._directories = set()
+        for temp_name in pending.values():
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+
+
+def atomic_write(
+    path: Union[str, Path], data: Union[str, bytes], fsync: Optional[str] = None
+) -> None:
+    """
+    파일 하나를 원자적으로 씁니다.
+
+    Args:
+        path: 대상 파일 경로
+        data: 파일 내용 (문자열은 UTF-8로 저장)
+        fsync: fsync 정책 (None이면 FSYNC_POLICY)
+    """
+    with AtomicWriter(fsync) as writer:
+        writer.write(path, data)
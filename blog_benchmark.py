@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+블로그 수집 파이프라인 벤치마크
+합성 Tistory RSS/Atom 피드와 WordPress REST API를 내보내는 로컬 블로그 서버를 띄우고,
+tistory_to_github_blog 파이프라인 전체(수집 → 필터링 → 포스트 생성)를 실행하여
+처리량(posts/s), 최대 메모리(peak RSS), 단계별 소요 시간을 보고합니다.
+
+사용 예:
+    # 합성 블로그 서버만 실행 (수동 테스트용)
+    python blog_benchmark.py serve --posts 10000 --port 8800
+
+    # 서버를 띄우고 전체 파이프라인 벤치마크 실행
+    python blog_benchmark.py run --posts 50000 --body-size 4000 --korean-ratio 0.7
+
+서버 경로:
+    /tistory                 피드 링크가 있는 홈페이지
+    /tistory/rss             RSS 2.0 피드 (--feed-format atom이면 Atom)
+    /wordpress/wp-json/wp/v2/posts
+                             WordPress REST 목록 (per_page, page, modified_after, _fields)
+"""
+
+import argparse
+import datetime
+import http.server
+import json
+import logging
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# 합성 포스트 문장 재료 (기술/비기술, 한국어/영어)
+TECH_WORDS_KO = ["보안", "클라우드", "쿠버네티스", "컨테이너", "인프라", "네트워크", "취약점"]
+TECH_WORDS_EN = [
+    "docker",
+    "kubernetes",
+    "python",
+    "terraform",
+    "security",
+    "devops",
+    "linux",
+    "graphql",
+]
+PLAIN_WORDS_KO = ["여행", "맛집", "주말", "산책", "요리", "카페", "운동", "독서", "날씨", "가족"]
+PLAIN_WORDS_EN = [
+    "weekend",
+    "coffee",
+    "garden",
+    "recipe",
+    "family",
+    "morning",
+    "walk",
+    "travel",
+]
+FILLER_KO = ["오늘은", "정리해", "보았습니다", "그리고", "다음에는", "자세히", "살펴봅니다"]
+FILLER_EN = ["today", "we", "look", "at", "the", "notes", "about", "and", "more"]
+
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+# 합성 포스트 기준 시각 (결정적인 출력을 위해 고정)
+BASE_DATE = datetime.datetime(2020, 1, 1, 9, 0, tzinfo=KST)
+
+
+class SyntheticBlog:
+    """
+    시드에 따라 항상 같은 합성 포스트를 만들어 RSS/Atom/WordPress 응답으로 직렬화합니다.
+
+    Args:
+        posts: 포스트 수
+        body_size: 포스트 본문 크기 (대략적인 문자 수)
+        korean_ratio: 한국어 포스트 비율 (0~1)
+        tech_ratio: 기술 관련 포스트 비율 (0~1)
+        seed: 난수 시드
+    """
+
+    def __init__(
+        self,
+        posts: int = 1000,
+        body_size: int = 2000,
+        korean_ratio: float = 0.5,
+        tech_ratio: float = 0.7,
+        seed: int = 0,
+    ):
+        self.posts = posts
+        self.body_size = body_size
+        self.korean_ratio = korean_ratio
+        self.tech_ratio = tech_ratio
+        self.seed = seed
+        self._items: Optional[List[Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def _sentence(self, rng: random.Random, korean: bool, tech: bool) -> str:
+        filler = FILLER_KO if korean else FILLER_EN
+        if tech:
+            topic = TECH_WORDS_KO if korean else TECH_WORDS_EN
+        else:
+            topic = PLAIN_WORDS_KO if korean else PLAIN_WORDS_EN
+        words = rng.choices(filler, k=6) + rng.choices(topic, k=2)
+        rng.shuffle(words)
+        return " ".join(words) + "."
+
+    def _make_post(self, index: int) -> Dict[str, Any]:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        korean = rng.random() < self.korean_ratio
+        tech = rng.random() < self.tech_ratio
+        topic = TECH_WORDS_KO if korean else TECH_WORDS_EN
+        if not tech:
+            topic = PLAIN_WORDS_KO if korean else PLAIN_WORDS_EN
+        title = f"{rng.choice(topic)} {rng.choice(topic)} #{index}"
+
+        sentences = []
+        length = 0
+        while length < self.body_size:
+            sentence = self._sentence(rng, korean, tech)
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        paragraphs = [
+            "<p>" + " ".join(sentences[i : i + 5]) + "</p>"
+            for i in range(0, len(sentences), 5)
+        ]
+        published = BASE_DATE + datetime.timedelta(hours=index)
+        return {
+            "id": index + 1,
+            "title": title,
+            "excerpt": "<p>" + sentences[0] + "</p>",
+            "content": "\n".join(paragraphs),
+            "date": published,
+            "modified": published + datetime.timedelta(minutes=rng.randrange(0, 600)),
+        }
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        """최신 글이 앞에 오는 합성 포스트 목록 (처음 접근할 때 한 번 생성)"""
+        with self._lock:
+            if self._items is None:
+                self._items = [self._make_post(i) for i in range(self.posts)][::-1]
+            return self._items
+
+    def rss(self, base_url: str) -> bytes:
+        """RSS 2.0 피드"""
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>',
+            f"<title>Synthetic Tistory</title><link>{base_url}</link>",
+        ]
+        for item in self.items:
+            link = f"{base_url}/{item['id']}"
+            parts.append(
+                f"<item><title>{escape(item['title'])}</title><link>{link}</link>"
+                f"<guid>{link}</guid>"
+                f"<description>{escape(item['content'])}</description>"
+                f"<pubDate>{format_datetime(item['date'])}</pubDate></item>"
+            )
+        parts.append("</channel></rss>")
+        return "".join(parts).encode("utf-8")
+
+    def atom(self, base_url: str) -> bytes:
+        """Atom 피드"""
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom">',
+            f'<title>Synthetic Tistory</title><link href="{base_url}"/>',
+            f"<id>{base_url}</id><updated>{BASE_DATE.isoformat()}</updated>",
+        ]
+        for item in self.items:
+            link = f"{base_url}/{item['id']}"
+            parts.append(
+                f'<entry><title>{escape(item["title"])}</title><link href="{link}"/>'
+                f"<id>{link}</id><published>{item['date'].isoformat()}</published>"
+                f"<updated>{item['modified'].isoformat()}</updated>"
+                f"<summary>{escape(item['excerpt'])}</summary>"
+                f'<content type="html">{escape(item["content"])}</content></entry>'
+            )
+        parts.append("</feed>")
+        return "".join(parts).encode("utf-8")
+
+    def wordpress_page(
+        self,
+        base_url: str,
+        page: int,
+        per_page: int,
+        modified_after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """WordPress REST 목록의 한 페이지와 전체 항목 수"""
+        items = self.items
+        if modified_after:
+            since = datetime.datetime.fromisoformat(modified_after)
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=KST)
+            items = [item for item in items if item["modified"] > since]
+
+        page_items = []
+        for item in items[(page - 1) * per_page : page * per_page]:
+            data = {
+                "id": item["id"],
+                "title": {"rendered": item["title"]},
+                "link": f"{base_url}/{item['id']}",
+                "date": item["date"].replace(tzinfo=None).isoformat(),
+                "modified": item["modified"].replace(tzinfo=None).isoformat(),
+                "modified_gmt": item["modified"]
+                .astimezone(datetime.timezone.utc)
+                .replace(tzinfo=None)
+                .isoformat(),
+                "excerpt": {"rendered": item["excerpt"]},
+                "content": {"rendered": item["content"]},
+            }
+            if fields:
+                data = {key: value for key, value in data.items() if key in fields}
+            page_items.append(data)
+        return page_items, len(items)
+
+
+class SyntheticBlogServer(http.server.ThreadingHTTPServer):
+    """
+    SyntheticBlog를 Tistory 형태(/tistory)와 WordPress 형태(/wordpress)로 제공하는 서버
+
+    Args:
+        address: (호스트, 포트) 튜플. 포트가 0이면 빈 포트를 사용
+        blog: 내보낼 합성 블로그
+        feed_format: "rss" 또는 "atom"
+        latency: 요청마다 추가할 지연 시간 (초)
+        error_rate: 503 오류로 응답할 확률 (0~1)
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        blog: SyntheticBlog,
+        feed_format: str = "rss",
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+    ):
+        super().__init__(address, SyntheticBlogHandler)
+        self.blog = blog
+        self.feed_format = feed_format
+        self.latency = latency
+        self.error_rate = error_rate
+        self._feeds: Dict[str, bytes] = {}
+        self._feed_lock = threading.Lock()
+        self._random = random.Random(blog.seed)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed(self) -> bytes:
+        """직렬화한 피드 (처음 요청할 때 한 번 생성)"""
+        with self._feed_lock:
+            if self.feed_format not in self._feeds:
+                base_url = f"{self.base_url}/tistory"
+                if self.feed_format == "atom":
+                    self._feeds["atom"] = self.blog.atom(base_url)
+                else:
+                    self._feeds["rss"] = self.blog.rss(base_url)
+            return self._feeds[self.feed_format]
+
+    def inject_error(self) -> bool:
+        with self._feed_lock:
+            return self._random.random() < self.error_rate
+
+
+class SyntheticBlogHandler(http.server.BaseHTTPRequestHandler):
+    """합성 블로그 요청 처리기 (HTTP/1.1 keep-alive)"""
+
+    protocol_version = "HTTP/1.1"
+    server: SyntheticBlogServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.inject_error():
+            self._send(503, b"injected error", "text/plain", {"Retry-After": "0"})
+            return
+
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/")
+        base_url = self.server.base_url
+        if self.server.feed_format == "atom":
+            feed_path, feed_type = "/tistory/atom.xml", "application/atom+xml"
+        else:
+            feed_path, feed_type = "/tistory/rss", "application/rss+xml"
+
+        if path == "/tistory":
+            body = (
+                f'<html><head><link rel="alternate" type="{feed_type}" '
+                f'href="{feed_path}"></head><body>Synthetic Tistory</body></html>'
+            )
+            self._send(200, body.encode("utf-8"), "text/html; charset=utf-8")
+        elif path == feed_path:
+            self._send(200, self.server.feed(), f"{feed_type}; charset=utf-8")
+        elif path == "/wordpress/wp-json/wp/v2/posts":
+            query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            try:
+                per_page = min(max(int(query.get("per_page", "10")), 1), 100)
+                page = max(int(query.get("page", "1")), 1)
+            except ValueError:
+                self._send(400, b'{"code":"rest_invalid_param"}', "application/json")
+                return
+            fields = query["_fields"].split(",") if query.get("_fields") else None
+            items, total = self.server.blog.wordpress_page(
+                f"{base_url}/wordpress",
+                page,
+                per_page,
+                query.get("modified_after"),
+                fields,
+            )
+            total_pages = max((total + per_page - 1) // per_page, 1)
+            if page > total_pages:
+                body = b'{"code":"rest_post_invalid_page_number"}'
+                self._send(400, body, "application/json")
+                return
+            self._send(
+                200,
+                json.dumps(items, ensure_ascii=False).encode("utf-8"),
+                "application/json; charset=UTF-8",
+                {"X-WP-Total": str(total), "X-WP-TotalPages": str(total_pages)},
+            )
+        elif path == "/wordpress":
+            body = b"<html><body>Synthetic WordPress</body></html>"
+            self._send(200, body, "text/html")
+        else:
+            self._send(404, b"not found", "text/plain")
+
+
+def _add_blog_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--posts", type=int, default=1000, help="블로그별 포스트 수")
+    parser.add_argument(
+        "--body-size", type=int, default=2000, help="포스트 본문 크기 (문자 수)"
+    )
+    parser.add_argument(
+        "--korean-ratio", type=float, default=0.5, help="한국어 포스트 비율 (0~1)"
+    )
+    parser.add_argument(
+        "--tech-ratio", type=float, default=0.7, help="기술 관련 포스트 비율 (0~1)"
+    )
+    parser.add_argument(
+        "--feed-format", choices=["rss", "atom"], default="rss", help="Tistory 피드 형식"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="요청마다 추가할 지연 시간 (초)"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="503 오류 응답 비율 (0~1)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+
+
+# run 명령이 서버 프로세스에 그대로 넘기는 옵션
+BLOG_OPTIONS = (
+    "posts",
+    "body_size",
+    "korean_ratio",
+    "tech_ratio",
+    "feed_format",
+    "latency",
+    "error_rate",
+    "seed",
+)
+
+
+def _server_from_args(
+    args: argparse.Namespace, host: str, port: int
+) -> SyntheticBlogServer:
+    blog = SyntheticBlog(
+        posts=args.posts,
+        body_size=args.body_size,
+        korean_ratio=args.korean_ratio,
+        tech_ratio=args.tech_ratio,
+        seed=args.seed,
+    )
+    return SyntheticBlogServer(
+        (host, port),
+        blog,
+        feed_format=args.feed_format,
+        latency=args.latency,
+        error_rate=args.error_rate,
+    )
+
+
+def serve(args: argparse.Namespace) -> None:
+    """합성 블로그 서버를 실행합니다. 첫 줄에 사용 중인 주소를 출력합니다."""
+    server = _server_from_args(args, args.host, args.port)
+    # 피드와 WordPress 항목은 첫 요청 전에 미리 만들어 둠
+    server.blog.items
+    server.feed()
+    print(f"SERVING {server.base_url}", flush=True)
+    logger.info(f"Tistory 블로그: {server.base_url}/tistory")
+    logger.info(f"WordPress 블로그: {server.base_url}/wordpress")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 메모리 사용량 (MB, Linux 기준 ru_maxrss는 KB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    합성 블로그 서버를 별도 프로세스로 띄우고 전체 파이프라인을 실행합니다.
+    서버를 분리하여 최대 메모리와 CPU 시간에는 파이프라인만 반영됩니다.
+
+    Returns:
+        벤치마크 결과 딕셔너리
+    """
+    import tistory_to_github_blog as pipeline
+
+    command = [sys.executable, str(Path(__file__).resolve()), "serve", "--port", "0"]
+    for option in BLOG_OPTIONS:
+        command += [f"--{option.replace('_', '-')}", str(getattr(args, option))]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    output_dir = Path(tempfile.mkdtemp(prefix="blog-benchmark-"))
+    stages: Dict[str, float] = {}
+    try:
+        line = server.stdout.readline().strip()
+        if not line.startswith("SERVING "):
+            raise RuntimeError(f"합성 블로그 서버 시작 실패: {line!r}")
+        base_url = line.split(" ", 1)[1]
+        pipeline.ALLOWED_DOMAINS.append(urlsplit(base_url).netloc)
+        blog_urls = [f"{base_url}/tistory", f"{base_url}/wordpress"]
+
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+
+        started = time.perf_counter()
+        all_posts, _ = pipeline.collect_blog_posts(
+            blog_urls,
+            workers=args.workers,
+            use_cache=False,
+            full_resync=True,
+            deadline=None,
+            use_classification_cache=args.classification_cache,
+            filter_report=None,
+            # 작업 디렉토리의 실제 동기화 상태와 탐색 캐시를 건드리지 않도록 메모리에서만 사용
+            sync_state=pipeline.WordPressSyncState(path=None, full_resync=True),
+            discovery=pipeline.FeedDiscoveryCache(path=None),
+        )
+        stages["collect"] = time.perf_counter() - started
+        filter_report = pipeline.FILTER_TELEMETRY.report()
+
+        stage_started = time.perf_counter()
+        unique_posts = {}
+        for post in all_posts:
+            unique_posts.setdefault(post["link"], post)
+        posts = list(unique_posts.values())
+        stages["dedupe"] = time.perf_counter() - stage_started
+
+        # 분류기만의 처리량 (수집 단계 안에서도 실행되지만 따로 측정)
+        stage_started = time.perf_counter()
+        pipeline.classify_batch(posts)
+        stages["classify"] = time.perf_counter() - stage_started
+
+        stage_started = time.perf_counter()
+        pipeline.create_jekyll_structure(output_dir, "benchmark-blog", "benchmark")
+        stages["structure"] = time.perf_counter() - stage_started
+
+        stage_started = time.perf_counter()
+        posts_dir = output_dir / "_posts"
+        summary = pipeline.write_jekyll_posts(
+            posts,
+            posts_dir,
+            render_workers=args.render_workers or pipeline.RENDER_WORKERS,
+        )
+        created = len(summary["written"])
+        stages["render"] = time.perf_counter() - stage_started
+
+        total = time.perf_counter() - started
+    finally:
+        logging.getLogger().setLevel(logging.INFO)
+        server.terminate()
+        server.wait()
+        if not args.keep_output:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    return {
+        "posts_per_blog": args.posts,
+        "served_posts": args.posts * 2,
+        "collected_posts": len(all_posts),
+        "created_posts": created,
+        "total_seconds": round(total, 3),
+        "posts_per_second": round(args.posts * 2 / total, 1) if total else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "stages": {name: round(seconds, 3) for name, seconds in stages.items()},
+        "filter_decisions": filter_report["decisions"],
+        "filter_match_time_ms": filter_report["match_time_ms"],
+        "output_dir": str(output_dir) if args.keep_output else None,
+    }
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="블로그 수집 파이프라인 로컬 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="합성 블로그 서버 실행")
+    _add_blog_arguments(serve_parser)
+    serve_parser.add_argument("--host", default="127.0.0.1", help="바인딩할 주소")
+    serve_parser.add_argument("--port", type=int, default=8800, help="포트 (0이면 빈 포트)")
+
+    run_parser = subparsers.add_parser("run", help="합성 블로그로 전체 파이프라인 벤치마크")
+    _add_blog_arguments(run_parser)
+    run_parser.add_argument(
+        "--workers", type=int, default=4, help="동시에 진행할 최대 HTTP 요청 수"
+    )
+    run_parser.add_argument(
+        "--render-workers",
+        type=int,
+        help="포스트 렌더링 프로세스 수 (기본: CPU 코어 수, 1이면 순차 렌더링)",
+    )
+    run_parser.add_argument("--json", metavar="FILE", help="결과를 JSON 파일로 저장")
+    run_parser.add_argument(
+        "--keep-output", action="store_true", help="생성된 Jekyll 디렉토리를 삭제하지 않음"
+    )
+    run_parser.add_argument(
+        "--verbose", action="store_true", help="파이프라인 INFO 로그 출력"
+    )
+    run_parser.add_argument(
+        "--classification-cache",
+        action="store_true",
+        help="분류 캐시 사용 (두 번째 실행부터 재분류 없이 측정)",
+    )
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        serve(args)
+        return
+
+    result = run_benchmark(args)
+    print(
+        f"포스트: 서버 {result['served_posts']}개 → 수집 {result['collected_posts']}개"
+        f" → 생성 {result['created_posts']}개"
+    )
+    print(f"전체: {result['total_seconds']:.3f}초 ({result['posts_per_second']} posts/s)")
+    print(f"최대 메모리: {result['peak_rss_mb']} MB")
+    for name, seconds in result["stages"].items():
+        print(f"  {name:<10} {seconds:8.3f}초")
+    match_time = result["filter_match_time_ms"]
+    print(
+        f"키워드 매칭: 포스트당 평균 {match_time['mean']:.3f}ms, "
+        f"p95 {match_time['p95']:.3f}ms ({result['filter_decisions']})"
+    )
+    if result["output_dir"]:
+        print(f"출력 디렉토리: {result['output_dir']}")
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import os
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from atomic_writer import atomic_write
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -304,8 +306,7 @@ def main():
     # 통합 계획 생성
     plan = generate_consolidation_plan(repos)
     
-    with open("PRIVATE_REPO_CONSOLIDATION_PLAN.md", "w", encoding="utf-8") as f:
-        f.write(plan)
+    atomic_write("PRIVATE_REPO_CONSOLIDATION_PLAN.md", plan)
     
     logger.info("통합 계획 생성 완료: PRIVATE_REPO_CONSOLIDATION_PLAN.md")
     
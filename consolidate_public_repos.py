@@ -11,6 +11,8 @@ import os
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from atomic_writer import atomic_write
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -138,8 +140,7 @@ def merge_repository_into_consolidated(owner: str, source_repo: str, target_repo
         except:
             # 빈 저장소
             readme_content = f"# {target_repo}\n\nConsolidated repository for related projects.\n"
-            with open(consolidated_path / "README.md", "w") as f:
-                f.write(readme_content)
+            atomic_write(consolidated_path / "README.md", readme_content)
             subprocess.run(['git', 'add', 'README.md'], cwd=consolidated_path, capture_output=True)
             subprocess.run(['git', 'commit', '-m', 'Initial commit'], cwd=consolidated_path, capture_output=True)
         
@@ -0,0 +1,937 @@
+#!/usr/bin/env python3
+"""
+블로그 피드 공통 수집 엔진
+readme_update.py, profile_readme_generator.py, tistory_to_github_blog.py가 함께 사용하는
+asyncio 기반 RSS/JSON 수집 모듈입니다.
+
+- 세마포어로 동시 요청 수 제한 (수백 개 피드도 협력적으로 동시 수집)
+- 타임아웃과 재시도 규칙을 한 곳에서 관리
+- 요청마다 User-Agent/Accept 헤더를 실제로 전송
+- ETag/Last-Modified 조건부 요청 캐시 (304 응답 시 저장된 결과 재사용)
+- 블로그별로 동작한 피드 엔드포인트를 기억하는 탐색 캐시
+- 호스트별 keep-alive 커넥션 풀과 gzip/deflate 압축 응답 지원
+- 호스트별 연결/읽기 타임아웃과 수집 단계 전체의 시간 예산(deadline)
+- 오류 분류, 지터가 있는 지수 백오프, 호스트별 서킷 브레이커
+- 오프라인 재현용 HTTP 기록(record)/재생(replay) 아카이브
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import http.client
+import json
+import logging
+import os
+import random
+import socket
+import ssl
+import threading
+import time
+import zlib
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+import feedparser
+
+from atomic_writer import FSYNC_NONE, atomic_write
+
+logger = logging.getLogger(__name__)
+
+# 네트워크 타임아웃 설정 (초)
+# socket.setdefaulttimeout처럼 프로세스 전역 상태를 바꾸지 않고 커넥션마다 적용합니다.
+CONNECT_TIMEOUT = 10
+REQUEST_TIMEOUT = 30  # 읽기 타임아웃
+
+# 호스트별 (연결, 읽기) 타임아웃 재정의
+HOST_TIMEOUTS: Dict[str, Tuple[float, float]] = {}
+
+# 재시도 설정 (지터가 있는 지수 백오프)
+MAX_RETRIES = 3
+RETRY_DELAY = 2  # 초, 첫 재시도 대기 시간의 기준값
+RETRY_MAX_DELAY = 30  # 초, 백오프 상한
+
+# 연속 실패가 이 횟수에 이르면 해당 호스트는 이번 실행 동안 건너뜀
+CIRCUIT_BREAKER_THRESHOLD = 5
+
+# 동시 요청 수 기본값
+DEFAULT_CONCURRENCY = 8
+
+# User-Agent 설정 (일부 서버에서 User-Agent가 없으면 차단할 수 있음)
+USER_AGENT = "Mozilla/5.0 (compatible; BlogRSSCollector/1.0; +https://github.com/Twodragon0/Blog)"
+
+FEED_ACCEPT = "application/rss+xml, application/atom+xml, application/xml, text/xml"
+JSON_ACCEPT = "application/json"
+
+# 호스트별로 유지할 최대 유휴 커넥션 수
+MAX_IDLE_CONNECTIONS = 8
+
+# 따라갈 최대 리다이렉트 횟수
+MAX_REDIRECTS = 5
+REDIRECT_STATUS = {301, 302, 303, 307, 308}
+
+# 재시도해도 결과가 바뀌지 않는 HTTP 상태 코드는 즉시 실패 처리
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+# HTTP 기록/재생 아카이브 파일 이름 (--record/--replay 디렉토리 안에 생성)
+HTTP_ARCHIVE_FILE = "http_archive.jsonl.gz"
+
+# 조건부 요청 캐시 디렉토리 (환경 변수로 변경 가능)
+HTTP_CACHE_DIR = os.environ.get("BLOG_HTTP_CACHE_DIR", ".cache/http")
+
+# 피드 탐색 캐시 파일과 유효 기간 (초)
+FEED_DISCOVERY_FILE = os.environ.get(
+    "BLOG_FEED_DISCOVERY_FILE", ".cache/feed_discovery.json"
+)
+FEED_DISCOVERY_TTL = 7 * 24 * 60 * 60
+
+# <link rel="alternate">로 인식할 피드 MIME 타입
+FEED_LINK_TYPES = {"application/rss+xml", "application/atom+xml", "application/feed+json"}
+
+# 캐시에 함께 저장할 응답 헤더 (WordPress 페이지 정보 등)
+CACHED_HEADERS = ("etag", "last-modified", "content-type", "x-wp-total", "x-wp-totalpages")
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """
+    수집 단계 전체에 주어진 시간 예산
+
+    Args:
+        budget: 예산 (초). None이면 제한 없음
+    """
+
+    def __init__(self, budget: Optional[float] = None):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget if budget else None
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초). 제한이 없으면 None"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def clamp(self, timeout: float) -> float:
+        """타임아웃이 남은 예산을 넘지 않도록 줄입니다."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return max(0.1, min(timeout, remaining))
+
+
+class FetchError(Exception):
+    """재시도 후에도 수집에 실패한 경우 발생하는 예외"""
+
+    def __init__(self, url: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{message}: {url}")
+        self.url = url
+        self.status = status
+
+
+class RetryPolicy:
+    """
+    오류를 분류하고 재시도 대기 시간을 계산합니다.
+
+    Args:
+        max_attempts: 요청별 최대 시도 횟수
+        base_delay: 백오프 기준값 (초)
+        max_delay: 백오프 상한 (초)
+        jitter: True이면 0~백오프 사이에서 무작위로 대기 (full jitter)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRIES,
+        base_delay: float = RETRY_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        jitter: bool = True,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    @staticmethod
+    def classify(error: Exception) -> Tuple[bool, bool, str]:
+        """
+        오류를 분류합니다.
+
+        Returns:
+            (재시도 가능 여부, 호스트 장애로 볼지 여부, 설명) 튜플.
+            4xx처럼 호스트는 정상 응답한 오류는 서킷 브레이커에 집계하지 않습니다.
+        """
+        if isinstance(error, HTTPError):
+            retryable = error.code in RETRYABLE_STATUS
+            return retryable, error.code >= 500, f"HTTP {error.code}"
+        if isinstance(error, (socket.timeout, TimeoutError)):
+            return True, True, "타임아웃"
+        if isinstance(error, (OSError, http.client.HTTPException)):
+            # URLError, ConnectionError와 HttpClient가 그대로 올리는 DNS(gaierror),
+            # TLS(SSLError), ENETUNREACH 같은 소켓 오류
+            return True, True, f"네트워크 오류 ({error})"
+        if isinstance(error, ValueError):
+            # 파싱 오류 (JSON 디코딩 실패, 항목 없는 bozo 피드 등): 잘린 응답일 수 있어 재시도
+            return True, False, f"파싱 오류 ({error})"
+        return False, False, f"예상치 못한 오류 ({error})"
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째(0부터) 실패 후 대기할 시간 (초)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+class CircuitBreaker:
+    """
+    호스트별 연속 실패 횟수를 세어, 임계값에 이르면 그 호스트로의 요청을
+    이번 실행이 끝날 때까지 즉시 실패시킵니다. 성공하면 횟수가 초기화됩니다.
+    이벤트 루프 스레드에서만 갱신하므로 잠금이 필요 없습니다.
+
+    Args:
+        threshold: 서킷을 여는 연속 실패 횟수
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD):
+        self.threshold = max(1, threshold)
+        self.failures: Dict[str, int] = {}
+
+    def is_open(self, host: str) -> bool:
+        return self.failures.get(host, 0) >= self.threshold
+
+    def record_success(self, host: str) -> None:
+        self.failures.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        self.failures[host] = self.failures.get(host, 0) + 1
+        if self.failures[host] == self.threshold:
+            logger.warning(
+                f"연속 {self.threshold}회 실패로 서킷 브레이커 열림, 이후 요청 건너뜀: {host}"
+            )
+
+
+def _to_jsonable(value: Any) -> Any:
+    """feedparser 결과를 JSON으로 저장할 수 있는 형태로 변환합니다."""
+    if isinstance(value, time.struct_time):
+        return list(value)
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _from_jsonable(value: Any, key: str = "") -> Any:
+    """_to_jsonable로 저장한 값을 FeedParserDict 형태로 복원합니다."""
+    if isinstance(value, dict):
+        return feedparser.FeedParserDict(
+            {k: _from_jsonable(v, k) for k, v in value.items()}
+        )
+    if isinstance(value, list):
+        if key.endswith("_parsed") and len(value) == 9:
+            return time.struct_time(value)
+        return [_from_jsonable(v) for v in value]
+    return value
+
+
+class HttpCache:
+    """
+    URL별 ETag/Last-Modified 검증자와 파싱된 결과를 디스크에 저장하는 캐시
+    URL마다 하나의 JSON 파일을 사용하므로 동시 요청 간 잠금이 필요 없습니다.
+
+    Args:
+        cache_dir: 캐시 파일을 저장할 디렉토리
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """저장된 캐시 항목을 반환합니다. 없거나 손상되었으면 None"""
+        path = self._path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"캐시 항목 손상, 무시함: {path}: {e}")
+            return None
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def put(self, url: str, headers: Dict[str, str], payload: Any) -> None:
+        """검증자가 있는 응답만 저장합니다 (임시 파일 후 교체)."""
+        if not headers.get("etag") and not headers.get("last-modified"):
+            return
+        entry = {
+            "url": url,
+            "stored_at": time.time(),
+            "headers": {k: headers[k] for k in CACHED_HEADERS if k in headers},
+            "payload": payload,
+        }
+        path = self._path(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 잃어도 다시 받으면 되는 캐시이므로 fsync 없이 원자적으로만 교체
+            atomic_write(path, json.dumps(entry, ensure_ascii=False), fsync=FSYNC_NONE)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {url}: {e}")
+
+    @staticmethod
+    def validators(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """캐시 항목으로부터 조건부 요청 헤더를 만듭니다."""
+        if not entry:
+            return {}
+        headers = entry.get("headers", {})
+        conditional = {}
+        if headers.get("etag"):
+            conditional["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+
+class _FeedLinkParser(HTMLParser):
+    """<link rel="alternate" type="application/rss+xml"> 태그의 href를 수집합니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.hrefs: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "link":
+            return
+        attributes = {k.lower(): (v or "") for k, v in attrs}
+        rel = attributes.get("rel", "").lower().split()
+        if "alternate" in rel and attributes.get("type", "").lower() in FEED_LINK_TYPES:
+            if attributes.get("href"):
+                self.hrefs.append(attributes["href"])
+
+
+def find_feed_links(html_text: str, base_url: str) -> List[str]:
+    """
+    홈페이지 HTML에서 피드 주소(<link rel="alternate">)를 추출합니다.
+
+    Args:
+        html_text: 홈페이지 HTML
+        base_url: 상대 경로를 해석할 기준 URL
+
+    Returns:
+        문서에 나온 순서대로 정리된 절대 URL 목록
+    """
+    parser = _FeedLinkParser()
+    try:
+        parser.feed(html_text)
+    except Exception as e:
+        logger.debug(f"홈페이지 HTML 파싱 오류: {e}")
+    links = []
+    for href in parser.hrefs:
+        url = urljoin(base_url + "/", href)
+        if url not in links:
+            links.append(url)
+    return links
+
+
+class FeedDiscoveryCache:
+    """
+    블로그별로 동작한 피드 엔드포인트(RSS 경로 또는 WordPress REST)를 기억합니다.
+    유효 기간이 지났거나 invalidate된 블로그는 다시 탐색합니다.
+
+    Args:
+        path: 캐시 JSON 파일 경로 (None이면 파일 없이 메모리에서만 사용)
+        ttl: 항목 유효 기간 (초)
+    """
+
+    def __init__(
+        self, path: Optional[str] = FEED_DISCOVERY_FILE, ttl: float = FEED_DISCOVERY_TTL
+    ):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"피드 탐색 캐시를 읽을 수 없어 새로 만듭니다: {e}")
+
+    def get(self, blog_url: str) -> Optional[Dict[str, Any]]:
+        """유효 기간 안의 엔드포인트 정보를 반환합니다."""
+        entry = self.entries.get(blog_url)
+        if not entry:
+            return None
+        if time.time() - entry.get("discovered_at", 0) > self.ttl:
+            logger.debug(f"피드 탐색 캐시 만료: {blog_url}")
+            return None
+        return entry
+
+    def record(self, blog_url: str, kind: str, url: str) -> None:
+        """
+        동작한 엔드포인트를 기록합니다.
+
+        Args:
+            blog_url: 블로그 URL
+            kind: "rss" 또는 "wordpress"
+            url: 피드 또는 API URL
+        """
+        previous = self.entries.get(blog_url)
+        if previous and previous.get("kind") == kind and previous.get("url") == url:
+            if time.time() - previous.get("discovered_at", 0) <= self.ttl:
+                return
+        self.entries[blog_url] = {"kind": kind, "url": url, "discovered_at": time.time()}
+        self._dirty = True
+
+    def invalidate(self, blog_url: str) -> None:
+        """엔드포인트가 실패했을 때 항목을 제거하여 다시 탐색하게 합니다."""
+        if self.entries.pop(blog_url, None) is not None:
+            logger.info(f"피드 엔드포인트 실패, 다시 탐색합니다: {blog_url}")
+            self._dirty = True
+
+    def save(self) -> None:
+        """변경된 경우에만 캐시 파일을 저장합니다."""
+        if not self._dirty or self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(
+                self.path,
+                json.dumps(self.entries, ensure_ascii=False, indent=2),
+                fsync=FSYNC_NONE,
+            )
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"피드 탐색 캐시 저장 실패: {e}")
+
+
+class HttpClient:
+    """
+    호스트별 커넥션 풀을 사용하는 블로킹 HTTP 클라이언트 (스레드 안전)
+
+    같은 호스트로 가는 요청(WordPress 페이지, 피드 경로 탐색 등)은 keep-alive
+    커넥션을 재사용하고, gzip/deflate 압축 응답을 풀어서 돌려줍니다.
+
+    Args:
+        user_agent: 모든 요청에 보낼 User-Agent
+        connect_timeout: 기본 연결 타임아웃 (초)
+        read_timeout: 기본 읽기 타임아웃 (초)
+        host_timeouts: 호스트별 (연결, 읽기) 타임아웃 재정의
+        max_idle: 호스트별로 보관할 최대 유휴 커넥션 수
+    """
+
+    def __init__(
+        self,
+        user_agent: str = USER_AGENT,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = REQUEST_TIMEOUT,
+        host_timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        max_idle: int = MAX_IDLE_CONNECTIONS,
+    ):
+        self.user_agent = user_agent
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.host_timeouts = dict(HOST_TIMEOUTS if host_timeouts is None else host_timeouts)
+        self.max_idle = max_idle
+        self._ssl_context = ssl.create_default_context()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """유휴 커넥션을 꺼내거나 새로 만듭니다. (커넥션, 재사용 여부)"""
+        with self._lock:
+            pool = self._idle.get((scheme, netloc))
+            if pool:
+                return pool.pop(), True
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(netloc, context=self._ssl_context)
+        else:
+            connection = http.client.HTTPConnection(netloc)
+        return connection, False
+
+    def timeouts_for(
+        self, netloc: str, deadline: Optional[Deadline] = None
+    ) -> Tuple[float, float]:
+        """호스트의 (연결, 읽기) 타임아웃을 남은 예산에 맞춰 반환합니다."""
+        host = netloc.split(":")[0]
+        connect, read = self.host_timeouts.get(
+            host, (self.connect_timeout, self.read_timeout)
+        )
+        if deadline:
+            connect, read = deadline.clamp(connect), deadline.clamp(read)
+        return connect, read
+
+    def _release(self, scheme: str, netloc: str, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            pool = self._idle.setdefault((scheme, netloc), [])
+            if len(pool) < self.max_idle:
+                pool.append(connection)
+                return
+        connection.close()
+
+    @staticmethod
+    def _decode_body(body: bytes, encoding: str) -> bytes:
+        encoding = encoding.strip().lower()
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # zlib 헤더 없이 raw deflate로 보내는 서버 대응
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        return body
+
+    def _request_once(
+        self,
+        scheme: str,
+        netloc: str,
+        target: str,
+        headers: Dict[str, str],
+        deadline: Optional[Deadline],
+    ) -> Tuple[int, str, Dict[str, str], bytes, http.client.HTTPMessage]:
+        connect_timeout, read_timeout = self.timeouts_for(netloc, deadline)
+        connection, reused = self._acquire(scheme, netloc)
+        try:
+            if connection.sock is None:
+                connection.timeout = connect_timeout
+                connection.connect()
+            connection.sock.settimeout(read_timeout)
+            connection.request("GET", target, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            if not reused:
+                raise
+            # 서버가 이미 닫은 keep-alive 커넥션이면 새 커넥션으로 한 번 더 시도
+            return self._request_once(scheme, netloc, target, headers, deadline)
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(scheme, netloc, connection)
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        return response.status, response.reason, response_headers, body, response.msg
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        GET 요청을 보냅니다. 리다이렉트는 최대 MAX_REDIRECTS번 따라갑니다.
+        deadline이 있으면 소켓 타임아웃이 남은 예산을 넘지 않습니다.
+
+        Returns:
+            (상태 코드, 압축 해제된 본문, 소문자 키의 응답 헤더) 튜플.
+            304이면 본문은 비어 있습니다.
+
+        Raises:
+            HTTPError: 4xx/5xx 응답
+            URLError: 지원하지 않는 URL 또는 리다이렉트 초과
+        """
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        request_headers.update(headers or {})
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.netloc:
+                raise URLError(f"지원하지 않는 URL: {url}")
+            target = parts.path or "/"
+            if parts.query:
+                target += f"?{parts.query}"
+
+            status, reason, response_headers, body, message = self._request_once(
+                parts.scheme, parts.netloc, target, request_headers, deadline
+            )
+            if status in REDIRECT_STATUS and response_headers.get("location"):
+                url = urljoin(url, response_headers["location"])
+                logger.debug(f"리다이렉트 ({status}): {url}")
+                continue
+            if status == 304:
+                return status, b"", response_headers
+            if status >= 400:
+                raise HTTPError(url, status, reason, message, None)
+            body = self._decode_body(body, response_headers.get("content-encoding", ""))
+            return status, body, response_headers
+
+        raise URLError(f"리다이렉트 횟수 초과: {url}")
+
+    def close(self) -> None:
+        """보관 중인 모든 유휴 커넥션을 닫습니다."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for pool in pools.values():
+            for connection in pool:
+                connection.close()
+
+
+class HttpArchive:
+    """
+    HTTP 응답(헤더, 본문, 소요 시간)을 gzip으로 압축한 JSON Lines 파일로 저장하고 읽습니다.
+    같은 URL을 여러 번 요청한 경우 순서대로 모두 보관합니다.
+
+    Args:
+        directory: 아카이브 디렉토리
+    """
+
+    def __init__(self, directory: str):
+        self.path = Path(directory) / HTTP_ARCHIVE_FILE
+        self._records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        url: str,
+        status: Optional[int],
+        headers: Dict[str, str],
+        body: bytes,
+        elapsed: float,
+        error: Optional[str] = None,
+    ) -> None:
+        record = {
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "body": base64.b64encode(body).decode("ascii"),
+            "elapsed": round(elapsed, 4),
+        }
+        if error:
+            record["error"] = error
+        with self._lock:
+            self._records.append(record)
+
+    def save(self) -> None:
+        """기록한 응답을 아카이브 파일로 저장합니다."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            records = list(self._records)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        logger.info(f"HTTP 응답 {len(records)}개 기록 완료: {self.path}")
+
+    def load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """URL별 응답 목록을 읽습니다."""
+        responses: Dict[str, List[Dict[str, Any]]] = {}
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    responses.setdefault(record["url"], []).append(record)
+        return responses
+
+
+class RecordingHttpClient(HttpClient):
+    """실제 네트워크로 요청하면서 모든 응답을 HttpArchive에 기록하는 클라이언트"""
+
+    def __init__(self, archive: HttpArchive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        started = time.perf_counter()
+        try:
+            status, body, response_headers = super().get(url, headers, deadline)
+        except HTTPError as e:
+            self.archive.add(
+                url, e.code, {k.lower(): v for k, v in (e.headers or {}).items()},
+                b"", time.perf_counter() - started,
+            )
+            raise
+        except Exception as e:
+            self.archive.add(url, None, {}, b"", time.perf_counter() - started, error=str(e))
+            raise
+        self.archive.add(url, status, response_headers, body, time.perf_counter() - started)
+        return status, body, response_headers
+
+    def close(self) -> None:
+        super().close()
+        self.archive.save()
+
+
+class ReplayHttpClient(HttpClient):
+    """
+    HttpArchive에 기록된 응답을 네트워크 없이 돌려주는 클라이언트
+
+    Args:
+        archive: 재생할 아카이브
+        realtime: True이면 기록된 소요 시간만큼 기다렸다가 응답
+    """
+
+    def __init__(self, archive: HttpArchive, realtime: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.responses = archive.load()
+        self.realtime = realtime
+        self._served: Dict[str, int] = {}
+        logger.info(f"HTTP 아카이브 재생: {sum(map(len, self.responses.values()))}개 응답")
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        records = self.responses.get(url)
+        if not records:
+            raise HTTPError(url, 404, "아카이브에 없는 요청", http.client.HTTPMessage(), None)
+        # 같은 URL을 여러 번 요청하면 기록된 순서대로, 마지막 응답은 반복해서 돌려줌
+        with self._lock:
+            index = self._served.get(url, 0)
+            self._served[url] = index + 1
+        record = records[min(index, len(records) - 1)]
+        if self.realtime:
+            time.sleep(record.get("elapsed", 0))
+
+        if record.get("error"):
+            raise URLError(record["error"])
+        status = record["status"]
+        if status >= 400:
+            message = http.client.HTTPMessage()
+            for name, value in record["headers"].items():
+                message[name] = value
+            raise HTTPError(url, status, "기록된 오류 응답", message, None)
+        return status, base64.b64decode(record["body"]), record["headers"]
+
+
+class FeedFetcher:
+    """
+    RSS 피드와 JSON API를 비동기로 수집하는 공통 엔진
+
+    Args:
+        concurrency: 동시에 진행할 최대 요청 수
+        timeout: 요청별 읽기 타임아웃 (초)
+        max_retries: 요청별 최대 시도 횟수 (retry_policy가 없을 때 사용)
+        retry_delay: 백오프 기준값 (초, retry_policy가 없을 때 사용)
+        user_agent: 요청에 사용할 User-Agent
+        cache: 조건부 요청 캐시 (None이면 항상 전체 응답을 받음)
+        client: 공유할 HTTP 클라이언트 (None이면 새 커넥션 풀 생성)
+        deadline: 이 fetcher로 하는 모든 요청에 적용할 전체 시간 예산
+        retry_policy: 오류 분류와 백오프 규칙
+        breaker: 호스트별 서킷 브레이커
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        retry_delay: float = RETRY_DELAY,
+        user_agent: str = USER_AGENT,
+        cache: Optional[HttpCache] = None,
+        client: Optional[HttpClient] = None,
+        deadline: Optional[Deadline] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries, retry_delay)
+        self.breaker = breaker or CircuitBreaker()
+        self.user_agent = user_agent
+        self.cache = cache
+        self.client = client or HttpClient(user_agent=user_agent, read_timeout=timeout)
+        self.deadline = deadline or Deadline()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 실행 중인 이벤트 루프 안에서 생성해야 합니다.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def _get(
+        self, url: str, accept: str, conditional: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        블로킹 HTTP GET (워커 스레드에서 실행)
+
+        Returns:
+            (상태 코드, 본문, 소문자 키의 응답 헤더) 튜플. 304이면 본문은 비어 있습니다.
+        """
+        headers = {"Accept": accept}
+        headers.update(conditional or {})
+        return self.client.get(url, headers, deadline=self.deadline)
+
+    async def _get_cached(
+        self, url: str, accept: str
+    ) -> Tuple[Optional[Dict[str, Any]], bytes, Dict[str, str]]:
+        """
+        캐시 검증자를 붙여 요청합니다.
+
+        Returns:
+            (304이면 캐시 항목 아니면 None, 본문, 응답 헤더) 튜플
+        """
+        entry = self.cache.get(url) if self.cache else None
+        status, body, headers = await asyncio.to_thread(
+            self._get, url, accept, HttpCache.validators(entry)
+        )
+        if status == 304 and entry:
+            logger.debug(f"변경 없음 (304), 캐시 사용: {url}")
+            return entry, b"", headers
+        return None, body, headers
+
+    async def _with_retries(
+        self,
+        url: str,
+        operation: Callable[[], Awaitable[T]],
+        max_retries: Optional[int] = None,
+    ) -> T:
+        """
+        재시도 정책과 서킷 브레이커를 적용하여 operation을 실행합니다.
+        max_retries를 지정하면 이 요청에 한해 시도 횟수를 바꿉니다 (탐색용 단발 요청 등).
+        """
+        policy = self.retry_policy
+        attempts = max(1, max_retries or policy.max_attempts)
+        host = urlsplit(url).netloc
+        last_error = "알 수 없는 오류"
+        for attempt in range(attempts):
+            if self.deadline.expired:
+                raise FetchError(url, "수집 시간 예산 초과")
+            if self.breaker.is_open(host):
+                raise FetchError(url, "서킷 브레이커 열림, 호스트 건너뜀")
+            try:
+                async with self.semaphore:
+                    if self.deadline.expired:
+                        raise FetchError(url, "수집 시간 예산 초과")
+                    result = await operation()
+                self.breaker.record_success(host)
+                return result
+            except FetchError:
+                raise
+            except Exception as e:
+                retryable, host_failure, last_error = policy.classify(e)
+                if host_failure:
+                    self.breaker.record_failure(host)
+                else:
+                    # 호스트는 응답했으므로 연속 실패 횟수에 넣지 않음
+                    self.breaker.record_success(host)
+                if not retryable:
+                    status = e.code if isinstance(e, HTTPError) else None
+                    raise FetchError(url, last_error, status=status) from e
+
+            logger.debug(
+                f"{last_error} (시도 {attempt + 1}/{attempts}): {url}"
+            )
+            if attempt < attempts - 1:
+                delay = policy.backoff(attempt)
+                remaining = self.deadline.remaining()
+                if remaining is not None and remaining <= delay:
+                    raise FetchError(url, f"{last_error}, 재시도할 시간 예산 없음")
+                await asyncio.sleep(delay)
+
+        raise FetchError(url, last_error)
+
+    async def fetch_bytes(
+        self, url: str, accept: str = "*/*", max_retries: Optional[int] = None
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """URL 본문과 응답 헤더를 가져옵니다."""
+
+        async def operation():
+            _, body, headers = await asyncio.to_thread(self._get, url, accept)
+            return body, headers
+
+        return await self._with_retries(url, operation, max_retries)
+
+    async def fetch_feed(
+        self, url: str, max_retries: Optional[int] = None
+    ) -> feedparser.FeedParserDict:
+        """
+        RSS/Atom 피드를 가져와 파싱합니다.
+
+        Raises:
+            FetchError: 재시도 후에도 항목이 있는 피드를 얻지 못한 경우
+        """
+
+        async def operation():
+            cached, body, headers = await self._get_cached(url, FEED_ACCEPT)
+            if cached:
+                return _from_jsonable(cached["payload"])
+            feed = feedparser.parse(body, response_headers=headers)
+            if feed.bozo and not feed.get("entries"):
+                raise ValueError(feed.get("bozo_exception") or "잘못된 피드")
+            if self.cache:
+                snapshot = {
+                    "feed": feed.get("feed", {}),
+                    "entries": feed.get("entries", []),
+                    "version": feed.get("version", ""),
+                    "bozo": 0,
+                }
+                self.cache.put(url, headers, _to_jsonable(snapshot))
+            return feed
+
+        return await self._with_retries(url, operation, max_retries)
+
+    async def fetch_json(self, url: str) -> Tuple[Any, Dict[str, str]]:
+        """
+        JSON API 응답을 가져옵니다.
+
+        Returns:
+            (디코딩된 JSON, 응답 헤더) 튜플
+        """
+
+        async def operation():
+            cached, body, headers = await self._get_cached(url, JSON_ACCEPT)
+            if cached:
+                return cached["payload"], {**cached["headers"], **headers}
+            data = json.loads(body.decode("utf-8"))
+            if self.cache:
+                self.cache.put(url, headers, data)
+            return data, headers
+
+        return await self._with_retries(url, operation)
+
+    async def fetch_feeds(
+        self, urls: List[str]
+    ) -> List[Optional[feedparser.FeedParserDict]]:
+        """
+        여러 피드를 동시에 수집합니다. 실패한 피드는 None으로 반환됩니다.
+        결과는 urls 순서를 따릅니다.
+        """
+        results = await asyncio.gather(
+            *(self.fetch_feed(url) for url in urls), return_exceptions=True
+        )
+        feeds = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"피드 수집 실패: {result}")
+                feeds.append(None)
+            else:
+                feeds.append(result)
+        return feeds
+
+    def close(self) -> None:
+        """HTTP 커넥션 풀을 닫습니다."""
+        self.client.close()
@@ -11,6 +11,8 @@ import logging
 import subprocess
 from typing import List, Dict, Optional
 
+from atomic_writer import atomic_write
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -243,8 +245,7 @@ def main():
     
     # 통합 가이드 생성
     guide = generate_consolidation_guide()
-    with open("REPO_CONSOLIDATION_GUIDE.md", "w", encoding="utf-8") as f:
-        f.write(guide)
+    atomic_write("REPO_CONSOLIDATION_GUIDE.md", guide)
     
     logger.info("저장소 통합 가이드 생성 완료: REPO_CONSOLIDATION_GUIDE.md")
     
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+키워드 매칭 모듈
+여러 키워드를 한 번에 찾는 Aho-Corasick 자동자와 단어 경계를 지키는 토큰 색인을 제공합니다.
+
+키워드 목록으로 자동자를 한 번만 만들어 두면, 본문 길이에 비례하는 한 번의
+순회로 모든 키워드 출현(겹치는 키워드 포함)을 찾을 수 있습니다.
+키워드마다 본문 전체를 다시 훑는 방식(키워드 수 × 본문 길이)을 대체합니다.
+
+KeywordIndex는 본문을 한 번 토큰화한 뒤 영문 키워드는 단어 단위로만 비교하여
+"it", "go", "git" 같은 짧은 키워드가 다른 단어 안에서 잘못 잡히지 않도록 합니다.
+
+KeywordScorer는 포스트 묶음을 희소 문서×키워드 행렬로 만들어 가중 점수를 한 번에
+계산합니다. NumPy가 설치되어 있으면 벡터 연산을 사용하고, 없으면 순수 파이썬으로 계산합니다.
+"""
+
+import re
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성: 없으면 순수 파이썬으로 점수 계산
+    np = None
+
+# 영문/숫자 단어 (c++, c# 포함) 또는 한글 음절 연속
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\+\+|#)?|[가-힣]+")
+
+
+class KeywordMatcher:
+    """
+    대소문자를 구분하지 않는 다중 키워드 부분 문자열 매처 (Aho-Corasick)
+
+    실패 링크를 미리 따라가 모든 상태의 전이를 채운 결정적 자동자로 만들어 두므로
+    매칭할 때는 문자 하나당 사전 조회 한 번만 합니다.
+
+    Args:
+        keywords: 찾을 키워드 목록 (소문자로 정규화됨)
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: FrozenSet[str] = frozenset(
+            keyword.lower() for keyword in keywords if keyword
+        )
+
+        # 1) 키워드 트라이 생성
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for keyword in sorted(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions[state][char] = next_state
+                    transitions.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] += (keyword,)
+
+        # 2) 너비 우선으로 실패 링크를 계산하면서 빠진 전이를 실패 상태의 전이로 채움
+        fail = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            trie_edges = list(transitions[state].items())
+            if state:
+                for char, target in transitions[fail[state]].items():
+                    transitions[state].setdefault(char, target)
+            for char, next_state in trie_edges:
+                fail[next_state] = transitions[fail[state]].get(char, 0)
+                outputs[next_state] += outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def find(self, text: str) -> Set[str]:
+        """
+        본문에 나타나는 모든 키워드를 찾습니다.
+
+        Args:
+            text: 검색할 본문 (대소문자 무관)
+
+        Returns:
+            발견된 키워드 집합
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        state = 0
+        hits: Set[str] = set()
+        for char in text.lower():
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                hits.update(outputs[state])
+        return hits
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    본문을 소문자 토큰 목록으로 나눕니다.
+    영문/숫자 단어와 한글 어절(조사 포함)이 각각 하나의 토큰이 됩니다.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _is_hangul(token: str) -> bool:
+    return "가" <= token[0] <= "힣"
+
+
+class KeywordIndex:
+    """
+    단어 경계를 지키는 키워드 색인
+
+    - 영문 키워드: 토큰이 정확히 같을 때만 일치 ("it"은 "with"에 일치하지 않음)
+    - 한글 키워드: 띄어쓰기 없이 붙는 조사/복합어를 고려해 한글 토큰 안의 부분 문자열로 일치
+    - 여러 단어 키워드("github actions", "ci/cd"): 연속된 토큰으로 일치.
+      한글 단어는 조사가 붙어도 되도록 접두사로 비교
+
+    Args:
+        keywords: 찾을 키워드 목록 (소문자로 정규화됨)
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: FrozenSet[str] = frozenset(
+            keyword.lower() for keyword in keywords if keyword
+        )
+        # 토큰 → 키워드 (영문 단일 단어)
+        self._words: Dict[str, Set[str]] = {}
+        hangul: Dict[str, Set[str]] = {}
+        # 첫 토큰 → (토큰 튜플, 키워드) 목록 (여러 단어)
+        self._phrases: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        for keyword in self.keywords:
+            tokens = tuple(tokenize(keyword))
+            if not tokens:
+                continue
+            if len(tokens) > 1:
+                self._phrases.setdefault(tokens[0], []).append((tokens, keyword))
+            elif _is_hangul(tokens[0]):
+                hangul.setdefault(tokens[0], set()).add(keyword)
+            else:
+                self._words.setdefault(tokens[0], set()).add(keyword)
+
+        self._hangul_keywords = hangul
+        self._hangul = KeywordMatcher(hangul)
+
+    def match_tokens(self, tokens: List[str]) -> Set[str]:
+        """
+        토큰 목록에서 일치하는 모든 키워드를 찾습니다.
+
+        Args:
+            tokens: tokenize()로 만든 토큰 목록
+
+        Returns:
+            발견된 키워드 집합
+        """
+        distinct = set(tokens)
+        hits: Set[str] = set()
+        for token in distinct & self._words.keys():
+            hits |= self._words[token]
+
+        # 한글 토큰은 서로 다른 것만 모아 자동자로 한 번에 검사 (공백은 키워드에 없음)
+        hangul_text = " ".join(token for token in distinct if _is_hangul(token))
+        for term in self._hangul.find(hangul_text):
+            hits |= self._hangul_keywords[term]
+
+        for first in distinct & self._phrases.keys():
+            for phrase, keyword in self._phrases[first]:
+                if keyword not in hits and self._has_phrase(tokens, phrase):
+                    hits.add(keyword)
+        return hits
+
+    @staticmethod
+    def _has_phrase(tokens: List[str], phrase: Tuple[str, ...]) -> bool:
+        end = len(tokens) - len(phrase) + 1
+        start = 0
+        while True:
+            try:
+                start = tokens.index(phrase[0], start, max(end, 0))
+            except ValueError:
+                return False
+            if all(
+                tokens[start + i] == part
+                or (_is_hangul(part) and tokens[start + i].startswith(part))
+                for i, part in enumerate(phrase[1:], 1)
+            ):
+                return True
+            start += 1
+
+    def find(self, text: str) -> Set[str]:
+        """본문을 토큰화하여 일치하는 모든 키워드를 찾습니다."""
+        return self.match_tokens(tokenize(text))
+
+
+class KeywordScorer:
+    """
+    키워드 가중치 기반 관련도 점수 계산기
+
+    포스트마다 (제목 일치, 본문 일치) 키워드를 구한 뒤 문서×키워드 희소 행렬로 모아
+    점수 = Σ 키워드 가중치 × (제목 가중치·제목 일치 + 본문 가중치·본문 일치)
+    를 한 번에 계산합니다. 제외 키워드에는 음수 가중치(감점)를 주면 됩니다.
+
+    Args:
+        index: 키워드 색인
+        weights: 키워드 → 가중치 (없는 키워드는 0)
+        title_weight: 제목에서 일치했을 때의 배수
+        body_weight: 본문에서 일치했을 때의 배수
+        threshold: 이 점수 이상이면 관련 포스트로 판단
+    """
+
+    def __init__(
+        self,
+        index: KeywordIndex,
+        weights: Dict[str, float],
+        title_weight: float = 3.0,
+        body_weight: float = 1.0,
+        threshold: float = 1.0,
+    ):
+        self.index = index
+        self.terms = sorted(index.keywords)
+        self._columns = {term: column for column, term in enumerate(self.terms)}
+        self.weights = [float(weights.get(term, 0.0)) for term in self.terms]
+        self.title_weight = title_weight
+        self.body_weight = body_weight
+        self.threshold = threshold
+
+    def match(
+        self, documents: Iterable[Tuple[str, str]]
+    ) -> List[Tuple[Set[str], Set[str]]]:
+        """(제목, 본문) 목록에서 각각 일치한 키워드 집합을 구합니다."""
+        return [
+            (self.index.find(title), self.index.find(body)) for title, body in documents
+        ]
+
+    def term_matrix(
+        self, matches: List[Tuple[Set[str], Set[str]]]
+    ) -> Tuple[List[int], List[int], List[float]]:
+        """
+        일치 결과를 희소 문서×키워드 행렬(COO 형식)로 변환합니다.
+
+        Returns:
+            (행 번호, 열 번호, 값) 리스트 튜플. 값은 제목/본문 배수를 반영한 출현 점수
+        """
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+        for row, (title_hits, body_hits) in enumerate(matches):
+            for term in title_hits | body_hits:
+                rows.append(row)
+                columns.append(self._columns[term])
+                values.append(
+                    self.title_weight * (term in title_hits)
+                    + self.body_weight * (term in body_hits)
+                )
+        return rows, columns, values
+
+    def score_matches(self, matches: List[Tuple[Set[str], Set[str]]]) -> List[float]:
+        """일치 결과 묶음의 점수를 계산합니다."""
+        rows, columns, values = self.term_matrix(matches)
+        if np is not None:
+            weights = np.asarray(self.weights, dtype=float)
+            contributions = np.asarray(values, dtype=float) * weights[
+                np.asarray(columns, dtype=np.intp)
+            ]
+            return np.bincount(
+                np.asarray(rows, dtype=np.intp),
+                weights=contributions,
+                minlength=len(matches),
+            ).tolist()
+
+        scores = [0.0] * len(matches)
+        for row, column, value in zip(rows, columns, values):
+            scores[row] += value * self.weights[column]
+        return scores
+
+    def score(self, documents: Iterable[Tuple[str, str]]) -> List[float]:
+        """(제목, 본문) 목록의 점수를 계산합니다."""
+        return self.score_matches(self.match(documents))
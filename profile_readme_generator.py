@@ -4,12 +4,15 @@ GitHub Profile README 생성 스크립트
 Twodragon0 프로필 페이지용 README.md를 생성합니다.
 """
 
-import feedparser
+import asyncio
 import datetime
 import logging
 import html
 from typing import List, Dict
 
+from atomic_writer import atomic_write
+from feed_fetcher import Deadline, FeedFetcher, HttpCache
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +23,7 @@ logger = logging.getLogger(__name__)
 # 허용된 블로그 도메인
 ALLOWED_DOMAINS = ['twodragon.tistory.com', '2twodragon.com']
 MAX_POSTS = 5  # 프로필 페이지에는 최근 5개만 표시
+COLLECT_DEADLINE = 60  # 피드 수집 전체 시간 예산 (초)
 
 
 def fetch_recent_posts() -> List[Dict[str, str]]:
@@ -30,15 +34,18 @@ def fetch_recent_posts() -> List[Dict[str, str]]:
         "https://2twodragon.com"
     ]
     
-    for blog_url in blog_urls:
+    # 모든 피드를 공통 수집 엔진으로 동시에 가져옴 (실패한 피드는 None)
+    rss_urls = [f"{blog_url}/rss" for blog_url in blog_urls]
+    fetcher = FeedFetcher(cache=HttpCache(), deadline=Deadline(COLLECT_DEADLINE))
+    try:
+        feeds = asyncio.run(fetcher.fetch_feeds(rss_urls))
+    finally:
+        fetcher.close()
+    
+    for feed in feeds:
+        if feed is None:
+            continue
         try:
-            rss_url = f"{blog_url}/rss"
-            feed = feedparser.parse(rss_url)
-            
-            if feed.bozo and feed.bozo_exception:
-                logger.warning(f"RSS 피드 파싱 오류: {feed.bozo_exception}")
-                continue
-            
             for entry in feed.get('entries', [])[:MAX_POSTS]:
                 if 'link' in entry and 'title' in entry:
                     posts.append({
@@ -146,7 +153,6 @@ def generate_profile_readme() -> str:
 
 if __name__ == "__main__":
     content = generate_profile_readme()
-    with open("PROFILE_README.md", "w", encoding="utf-8") as f:
-        f.write(content)
+    atomic_write("PROFILE_README.md", content)
     logger.info("GitHub Profile README 생성 완료: PROFILE_README.md")
 
@@ -10,18 +10,27 @@ GitHub README 업데이트 스크립트
 - XSS 방지를 위한 HTML 이스케이프
 """
 
-import feedparser
+import argparse
+import asyncio
 import datetime
 import sys
 import logging
 import html
-import time
-import socket
 from pathlib import Path
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+
+from atomic_writer import atomic_write
+from feed_fetcher import (
+    Deadline,
+    FeedFetcher,
+    FetchError,
+    HttpArchive,
+    HttpCache,
+    HttpClient,
+    RecordingHttpClient,
+    ReplayHttpClient,
+)
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,15 +45,10 @@ ALLOWED_DOMAINS = ['twodragon.tistory.com', '2twodragon.com']
 # 최대 수집할 포스트 수
 MAX_POSTS = 30
 
-# 네트워크 타임아웃 설정 (초)
-REQUEST_TIMEOUT = 30
-
-# 재시도 설정
-MAX_RETRIES = 3
-RETRY_DELAY = 2  # 초
+# 네트워크 타임아웃/재시도/User-Agent 설정은 feed_fetcher 모듈에서 공통 관리합니다.
 
-# User-Agent 설정 (일부 서버에서 User-Agent가 없으면 차단할 수 있음)
-USER_AGENT = 'Mozilla/5.0 (compatible; BlogRSSCollector/1.0; +https://github.com/Twodragon0/Blog)'
+# 피드 수집 단계 전체 시간 예산 (초)
+COLLECT_DEADLINE = 120
 
 
 def validate_url(url: str) -> bool:
@@ -86,13 +90,14 @@ def sanitize_html(text: str) -> str:
     return html.escape(text)
 
 
-def fetch_blog_posts(blog_url: str) -> List[Dict[str, str]]:
+async def fetch_blog_posts(blog_url: str, fetcher: FeedFetcher) -> List[Dict[str, str]]:
     """
     블로그 RSS 피드에서 포스트 목록을 가져옵니다.
-    재시도 로직과 타임아웃 처리가 포함되어 있습니다.
+    재시도와 타임아웃은 공통 수집 엔진(feed_fetcher)이 처리합니다.
     
     Args:
         blog_url: 블로그 URL
+        fetcher: 공통 피드 수집 엔진
         
     Returns:
         포스트 정보 딕셔너리 리스트
@@ -104,55 +109,16 @@ def fetch_blog_posts(blog_url: str) -> List[Dict[str, str]]:
     rss_url = f"{blog_url}/rss"
     logger.info(f"RSS 피드 수집 중: {rss_url}")
     
-    # 재시도 로직
-    for attempt in range(MAX_RETRIES):
-        try:
-            # 타임아웃 설정을 위한 소켓 타임아웃
-            socket.setdefaulttimeout(REQUEST_TIMEOUT)
-            
-            # User-Agent를 포함한 요청 생성
-            request = Request(rss_url)
-            request.add_header('User-Agent', USER_AGENT)
-            request.add_header('Accept', 'application/rss+xml, application/xml, text/xml')
-            
-            # 피드 파싱 (feedparser가 내부적으로 요청 처리)
-            feed = feedparser.parse(rss_url)
-            
-            # 피드 파싱 오류 확인
-            if feed.bozo and feed.bozo_exception:
-                logger.warning(f"RSS 피드 파싱 오류 (시도 {attempt + 1}/{MAX_RETRIES}): {feed.bozo_exception}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))  # 지수 백오프
-                    continue
-                return []
-            
-            # 피드가 비어있는지 확인
-            if not feed.get('entries'):
-                logger.warning(f"RSS 피드에 항목이 없습니다: {rss_url}")
-                return []
-            
-            break  # 성공 시 루프 종료
-            
-        except (URLError, HTTPError) as e:
-            logger.warning(f"네트워크 오류 (시도 {attempt + 1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-                continue
-            logger.error(f"RSS 피드 수집 실패: {rss_url}")
-            return []
-        except socket.timeout:
-            logger.warning(f"타임아웃 오류 (시도 {attempt + 1}/{MAX_RETRIES}): {rss_url}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-                continue
-            logger.error(f"RSS 피드 수집 타임아웃: {rss_url}")
-            return []
-        except Exception as e:
-            logger.error(f"예상치 못한 오류 (시도 {attempt + 1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-                continue
-            return []
+    try:
+        feed = await fetcher.fetch_feed(rss_url)
+    except FetchError as e:
+        logger.error(f"RSS 피드 수집 실패: {e}")
+        return []
+    
+    # 피드가 비어있는지 확인
+    if not feed.get('entries'):
+        logger.warning(f"RSS 피드에 항목이 없습니다: {rss_url}")
+        return []
     
     # 피드 파싱이 성공했으므로 포스트 추출
     posts = []
@@ -187,6 +153,53 @@ def fetch_blog_posts(blog_url: str) -> List[Dict[str, str]]:
     return posts
 
 
+async def collect_all_posts(
+    blog_urls: List[str],
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None
+) -> List[List[Dict[str, str]]]:
+    """
+    모든 블로그의 RSS 피드를 동시에 수집합니다.
+    시간 예산(COLLECT_DEADLINE)이 끝나면 남은 피드는 stale로 기록하고
+    그때까지 수집한 포스트만으로 진행합니다.
+    
+    Args:
+        blog_urls: 블로그 URL 목록
+        record_dir: 모든 HTTP 응답을 기록할 아카이브 디렉토리
+        replay_dir: 네트워크 대신 응답을 재생할 아카이브 디렉토리
+        
+    Returns:
+        블로그별 포스트 리스트 (blog_urls 순서, 빈 결과는 제외)
+    """
+    if replay_dir:
+        client = ReplayHttpClient(HttpArchive(replay_dir))
+    elif record_dir:
+        client = RecordingHttpClient(HttpArchive(record_dir))
+    else:
+        client = HttpClient()
+    # 기록/재생 시에는 조건부 요청 캐시를 쓰지 않아야 항상 전체 응답이 남음
+    cache = None if record_dir or replay_dir else HttpCache()
+    fetcher = FeedFetcher(cache=cache, client=client, deadline=Deadline(COLLECT_DEADLINE))
+    
+    async def fetch_within_deadline(blog_url: str) -> List[Dict[str, str]]:
+        try:
+            return await asyncio.wait_for(
+                fetch_blog_posts(blog_url, fetcher),
+                timeout=fetcher.deadline.remaining()
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"시간 예산 초과로 피드를 건너뜀 (stale): {blog_url}")
+            return []
+    
+    try:
+        results = await asyncio.gather(
+            *(fetch_within_deadline(blog_url) for blog_url in blog_urls)
+        )
+    finally:
+        fetcher.close()
+    return [posts for posts in results if posts]
+
+
 def merge_and_sort_posts(posts_list: List[List[Dict[str, str]]]) -> List[Dict[str, str]]:
     """
     여러 블로그의 포스트를 병합하고 날짜순으로 정렬합니다.
@@ -308,22 +321,8 @@ def write_readme(content: str, output_path: str = "README.md") -> bool:
             logger.error("상위 디렉토리 접근 시도 감지")
             return False
         
-        # 임시 파일에 먼저 작성
-        temp_file = output_file.with_suffix('.tmp')
-        temp_file.write_text(content, encoding='utf-8')
-        
-        # 원본 파일이 존재하면 백업
-        if output_file.exists():
-            backup_file = output_file.with_suffix('.bak')
-            output_file.rename(backup_file)
-        
-        # 임시 파일을 원본 파일로 이동
-        temp_file.rename(output_file)
-        
-        # 백업 파일 삭제
-        backup_file = output_file.with_suffix('.bak')
-        if backup_file.exists():
-            backup_file.unlink()
+        # 같은 디렉토리의 임시 파일에 쓴 뒤 원자적으로 교체 (중단되어도 원본 유지)
+        atomic_write(output_file, content)
         
         logger.info(f"README.md 업데이트 완료: {output_path}")
         return True
@@ -338,6 +337,18 @@ def write_readme(content: str, output_path: str = "README.md") -> bool:
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='블로그 RSS 피드로 README.md 업데이트')
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument(
+        '--record', metavar='DIR',
+        help='수집 중 모든 HTTP 응답을 DIR에 기록 (오프라인 재현용)'
+    )
+    archive_group.add_argument(
+        '--replay', metavar='DIR',
+        help='네트워크 대신 DIR에 기록된 HTTP 응답으로 수집'
+    )
+    args = parser.parse_args()
+    
     blog_urls = [
         "https://twodragon.tistory.com",
         "https://2twodragon.com"
@@ -345,12 +356,10 @@ def main():
     
     logger.info("블로그 포스트 수집 시작")
     
-    # 각 블로그에서 포스트 수집
-    all_posts = []
-    for blog_url in blog_urls:
-        posts = fetch_blog_posts(blog_url)
-        if posts:
-            all_posts.append(posts)
+    # 각 블로그에서 포스트 동시 수집
+    all_posts = asyncio.run(
+        collect_all_posts(blog_urls, record_dir=args.record, replay_dir=args.replay)
+    )
     
     if not all_posts:
         logger.error("수집된 포스트가 없습니다.")
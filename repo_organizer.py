@@ -9,6 +9,8 @@ import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from atomic_writer import AtomicWriter
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -238,23 +240,18 @@ if __name__ == "__main__":
     # 정리 계획 생성
     plan = generate_organization_plan()
     
-    # 파일로 저장
-    with open("REPO_ORGANIZATION_PLAN.md", "w", encoding="utf-8") as f:
-        f.write(plan)
-    
-    logger.info("저장소 정리 계획 생성 완료: REPO_ORGANIZATION_PLAN.md")
-    
     # Archive 스크립트 생성
     archive_script = generate_archive_script()
-    with open("archive_repos.sh", "w", encoding="utf-8") as f:
-        f.write(archive_script)
     
-    logger.info("Archive 스크립트 생성 완료: archive_repos.sh")
-    
-    # JSON 형식으로도 저장
-    with open("repo_analysis.json", "w", encoding="utf-8") as f:
-        json.dump(analysis, f, ensure_ascii=False, indent=2)
+    # 파일로 저장 (세 파일을 한 묶음으로 원자적으로 기록)
+    with AtomicWriter() as writer:
+        writer.write("REPO_ORGANIZATION_PLAN.md", plan)
+        writer.write("archive_repos.sh", archive_script)
+        # JSON 형식으로도 저장
+        writer.write("repo_analysis.json", json.dumps(analysis, ensure_ascii=False, indent=2))
     
+    logger.info("저장소 정리 계획 생성 완료: REPO_ORGANIZATION_PLAN.md")
+    logger.info("Archive 스크립트 생성 완료: archive_repos.sh")
     logger.info("저장소 분석 결과 저장 완료: repo_analysis.json")
     
     # 콘솔 출력
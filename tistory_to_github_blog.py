@@ -10,22 +10,39 @@ IT, DevSecOps, 코딩 관련 포스트만 필터링하여 Jekyll 블로그 형
 - SQL 인젝션 방지 (파일명 생성 시)
 """
 
-import feedparser
+import asyncio
 import datetime
+import hashlib
 import sys
 import logging
 import html
 import time
-import socket
+import os
 import re
 import subprocess
 import json
 import argparse
-from pathlib import Path
-from typing import List, Dict, Optional, Set, Any
-from urllib.parse import urlparse, urljoin
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import List, Dict, Iterable, Optional, Set, Any, Tuple
+from urllib.parse import urlparse, urljoin, quote
+
+from atomic_writer import FSYNC_NONE, AtomicWriter, atomic_write
+from feed_fetcher import (
+    CONNECT_TIMEOUT,
+    REQUEST_TIMEOUT,
+    Deadline,
+    FeedDiscoveryCache,
+    FeedFetcher,
+    FetchError,
+    HttpArchive,
+    HttpCache,
+    HttpClient,
+    RecordingHttpClient,
+    ReplayHttpClient,
+    find_feed_links,
+)
+from keyword_matcher import KeywordIndex, KeywordScorer
 
 # 로깅 설정
 logging.basicConfig(
@@ -185,15 +202,170 @@ EXCLUDE_KEYWORDS = {
     "취업",
 }
 
-# 네트워크 타임아웃 설정 (초)
-REQUEST_TIMEOUT = 30
+# 일반 영어 단어와 겹치는 기술 키워드는 본문에 한 번 나온 것만으로는 통과하지 않도록 낮춤
+KEYWORD_WEIGHTS = {
+    "it": 0.5,
+    "go": 0.5,
+    "rest": 0.5,
+    "node": 0.5,
+    "shell": 0.5,
+    "swift": 0.5,
+    "spring": 0.5,
+    "lambda": 0.5,
+}
+
+# 관련도 점수: 제목 일치는 본문 일치보다 크게, 제외 키워드는 감점
+TITLE_WEIGHT = 3.0
+BODY_WEIGHT = 1.0
+EXCLUDE_PENALTY = 10.0
+TECH_SCORE_THRESHOLD = 1.0
+
+# 기술 키워드 → Jekyll 카테고리 분류 (여기에 없는 키워드는 IT로 분류)
+KEYWORD_CATEGORIES = {
+    "DevSecOps": (
+        "devsecops",
+        "devops",
+        "ci/cd",
+        "jenkins",
+        "github actions",
+        "gitlab",
+    ),
+    "보안": (
+        "보안",
+        "security",
+        "시큐리티",
+        "취약점",
+        "vulnerability",
+        "penetration",
+        "pentest",
+        "penetration testing",
+        "보안 점검",
+        "audit",
+        "burp",
+        "zap",
+        "nmap",
+        "metasploit",
+        "wireshark",
+        "owasp",
+        "sast",
+        "dast",
+    ),
+    "클라우드": (
+        "aws",
+        "azure",
+        "gcp",
+        "cloud",
+        "클라우드",
+        "kubernetes",
+        "k8s",
+        "docker",
+        "terraform",
+        "ansible",
+        "infrastructure",
+        "인프라",
+        "serverless",
+        "lambda",
+        "container",
+        "컨테이너",
+        "orchestration",
+        "microservice",
+        "마이크로서비스",
+    ),
+    "코딩": (
+        "개발",
+        "프로그래밍",
+        "코딩",
+        "소프트웨어",
+        "알고리즘",
+        "데이터구조",
+        "python",
+        "java",
+        "javascript",
+        "typescript",
+        "go",
+        "rust",
+        "c++",
+        "c#",
+        "ruby",
+        "php",
+        "swift",
+        "kotlin",
+        "scala",
+        "react",
+        "vue",
+        "angular",
+        "node",
+        "spring",
+        "django",
+        "flask",
+        "fastapi",
+        "git",
+        "github",
+        "api",
+        "rest",
+        "graphql",
+    ),
+    "시스템": (
+        "network",
+        "네트워크",
+        "linux",
+        "unix",
+        "shell",
+        "bash",
+        "powershell",
+        "monitoring",
+        "로깅",
+        "logging",
+        "observability",
+        "prometheus",
+        "grafana",
+        "elk",
+        "elasticsearch",
+    ),
+    "데이터베이스": (
+        "database",
+        "데이터베이스",
+        "sql",
+        "nosql",
+        "mongodb",
+        "postgresql",
+        "mysql",
+    ),
+}
+DEFAULT_CATEGORY = "IT"
+
+# 같은 대상을 가리키는 키워드는 하나의 태그로 합침
+TAG_ALIASES = {
+    "k8s": "kubernetes",
+    "pentest": "penetration testing",
+    "penetration": "penetration testing",
+    "시큐리티": "security",
+}
+MAX_CATEGORIES = 3
+MAX_TAGS = 8
+
+# 포함/제외 키워드를 단어 경계 기준으로 한 번에 찾는 색인 (import 시 한 번만 생성)
+KEYWORD_INDEX = KeywordIndex(TECH_KEYWORDS | EXCLUDE_KEYWORDS)
+_TECH_TERMS = frozenset(keyword.lower() for keyword in TECH_KEYWORDS)
+_EXCLUDE_TERMS = frozenset(keyword.lower() for keyword in EXCLUDE_KEYWORDS)
+KEYWORD_SCORER = KeywordScorer(
+    KEYWORD_INDEX,
+    {
+        **{term: KEYWORD_WEIGHTS.get(term, 1.0) for term in _TECH_TERMS},
+        **{term: -EXCLUDE_PENALTY for term in _EXCLUDE_TERMS},
+    },
+    title_weight=TITLE_WEIGHT,
+    body_weight=BODY_WEIGHT,
+    threshold=TECH_SCORE_THRESHOLD,
+)
+
+# 네트워크 타임아웃/재시도/User-Agent 설정은 feed_fetcher 모듈에서 공통 관리합니다.
 
-# 재시도 설정
-MAX_RETRIES = 3
-RETRY_DELAY = 2  # 초
+# 블로그 동시 수집 워커 수 기본값
+DEFAULT_FETCH_WORKERS = 4
 
-# User-Agent 설정
-USER_AGENT = "Mozilla/5.0 (compatible; BlogRSSCollector/1.0; +https://github.com/Twodragon0/Blog)"
+# 수집 단계 전체 시간 예산 (초)
+COLLECT_DEADLINE = 300
 
 
 def validate_url(url: str) -> bool:
@@ -234,92 +406,589 @@ def sanitize_html(text: str) -> str:
     return html.escape(text)
 
 
-def fetch_wordpress_posts(blog_url: str) -> List[Dict[str, Any]]:
+# HTML → 텍스트 변환용 패턴 (본문이 아닌 블록, 태그, 연속 공백)
+_HTML_SKIP_PATTERN = re.compile(
+    r"<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->", re.S | re.I
+)
+_HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# front matter excerpt 최대 길이 (문자 수)
+EXCERPT_LENGTH = 160
+
+
+def html_to_text(markup: str) -> str:
     """
-    WordPress REST API를 사용하여 포스트 목록을 가져옵니다.
-    IT, DevSecOps, 코딩 관련 포스트만 필터링합니다.
+    HTML에서 사람이 읽는 텍스트만 뽑아냅니다.
+    스크립트/스타일/주석과 태그(속성 포함)를 지우고 엔티티를 풀어 공백을 하나로 합칩니다.
+
+    Args:
+        markup: HTML 문자열
+
+    Returns:
+        일반 텍스트
     """
-    api_url = f"{blog_url}/wp-json/wp/v2/posts"
-    logger.info(f"WordPress API 수집 중: {api_url}")
+    if "<" in markup:
+        markup = _HTML_SKIP_PATTERN.sub(" ", markup)
+        markup = _HTML_TAG_PATTERN.sub(" ", markup)
+    if "&" in markup:
+        markup = html.unescape(markup)
+    return _WHITESPACE_PATTERN.sub(" ", markup).strip()
 
-    posts = []
-    page = 1
-    per_page = 100
 
-    while True:
+def post_text(post: Dict[str, Any]) -> str:
+    """
+    포스트의 일반 텍스트(본문, 없으면 설명)를 돌려줍니다.
+    처음 호출할 때 한 번만 변환하여 post["text"]에 저장해 두고 이후에는 재사용합니다.
+    """
+    text = post.get("text")
+    if text is None:
+        text = html_to_text(post.get("content") or post.get("description", ""))
+        post["text"] = text
+    return text
+
+
+def post_excerpt(post: Dict[str, Any], length: int = EXCERPT_LENGTH) -> str:
+    """포스트 일반 텍스트의 앞부분을 단어 경계에서 잘라 요약으로 사용합니다."""
+    text = post_text(post)
+    if len(text) <= length:
+        return text
+    cut = text.rfind(" ", 0, length)
+    return text[: cut if cut > 0 else length].rstrip() + "…"
+
+
+# WordPress REST API에서 실제로 사용하는 필드만 요청 (_embed 대신 _fields 프로젝션)
+WORDPRESS_FIELDS = "id,title,link,date,modified,modified_gmt,excerpt,content"
+WORDPRESS_PER_PAGE = 100
+
+# WordPress 증분 동기화 상태 파일
+WORDPRESS_SYNC_FILE = os.environ.get(
+    "BLOG_WORDPRESS_SYNC_FILE", ".cache/wordpress_sync.json"
+)
+
+# 포스트 분류 결과 캐시 파일 (환경 변수로 변경 가능)
+CLASSIFICATION_CACHE_FILE = os.environ.get(
+    "BLOG_CLASSIFICATION_CACHE_FILE", ".cache/classification.json"
+)
+
+# 토큰화/HTML 변환 등 분류 로직이 바뀌면 올려서 캐시를 무효화
+CLASSIFIER_VERSION = 1
+
+# 키워드 필터 통계 보고서 파일 (환경 변수로 변경 가능)
+FILTER_REPORT_FILE = os.environ.get(
+    "BLOG_FILTER_REPORT_FILE", ".cache/filter_report.json"
+)
+
+
+def _wordpress_item_to_post(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    WordPress REST API 항목을 포스트 딕셔너리로 변환합니다.
+    유효하지 않은 항목이면 None을 반환합니다. 기술 관련 여부는 classify_batch로 따로 판단합니다.
+    """
+    # 기본 정보 추출
+    title = sanitize_html(item["title"]["rendered"])
+    link = item["link"]
+
+    if not validate_url(link):
+        logger.warning(f"유효하지 않은 링크 URL: {link}")
+        return None
+
+    # 내용 추출
+    content = item.get("content", {}).get("rendered", "")
+    excerpt = item.get("excerpt", {}).get("rendered", "")
+
+    # 날짜 파싱
+    published_date = None
+    try:
+        if item.get("date"):
+            published_date = datetime.datetime.fromisoformat(
+                item["date"].replace("Z", "+00:00")
+            )
+    except (ValueError, KeyError):
+        pass
+
+    return {
+        "title": title,
+        "link": link,
+        "description": sanitize_html(excerpt),
+        "published": item.get("date", ""),
+        "published_date": published_date,
+        "content": content,
+        # 필터링·요약에 재사용할 일반 텍스트 (HTML은 여기서 한 번만 변환)
+        "text": html_to_text(content or excerpt),
+    }
+
+
+class WordPressSyncState:
+    """
+    WordPress 블로그별 증분 동기화 상태를 저장합니다.
+
+    블로그마다 지금까지 본 가장 최근 수정 시각(modified_gmt 기준)과
+    포스트 ID → 링크 목록을 기록하여, 다음 실행에서는 modified_after로
+    새 글과 수정된 글만 요청하고 사라진 ID로 삭제된 글을 찾아냅니다.
+
+    Args:
+        path: 상태 JSON 파일 경로 (None이면 파일 없이 메모리에서만 사용)
+        full_resync: True이면 저장된 기준 시각을 무시하고 전체를 다시 받음
+    """
+
+    def __init__(
+        self, path: Optional[str] = WORDPRESS_SYNC_FILE, full_resync: bool = False
+    ):
+        self.path = Path(path) if path else None
+        self.full_resync = full_resync
+        self.blogs: Dict[str, Dict[str, Any]] = {}
+        # 이번 실행에서 삭제가 확인된 포스트 링크 (블로그별)
+        self.deleted: Dict[str, List[str]] = {}
+        # 이번 실행에서 받은 포스트 링크와 갱신 전 상태 (revert용, 블로그별)
+        self.fetched: Dict[str, Set[str]] = {}
+        self._previous: Dict[str, Optional[Dict[str, Any]]] = {}
+        if self.path is None:
+            return
         try:
-            # 페이지네이션 지원
-            url = f"{api_url}?per_page={per_page}&page={page}&_embed"
+            self.blogs = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"WordPress 동기화 상태를 읽을 수 없어 전체 동기화합니다: {e}")
+
+    def modified_after(self, blog_url: str) -> Optional[str]:
+        """증분 요청에 사용할 기준 시각 (없거나 전체 동기화면 None)"""
+        if self.full_resync:
+            return None
+        return self.blogs.get(blog_url, {}).get("modified_after")
+
+    def known_posts(self, blog_url: str) -> Dict[str, str]:
+        """이전 실행까지 확인된 포스트 ID → 링크"""
+        return self.blogs.get(blog_url, {}).get("posts", {})
+
+    def update(
+        self,
+        blog_url: str,
+        items: List[Dict[str, Any]],
+        current_ids: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        수집한 항목으로 기준 시각과 포스트 목록을 갱신합니다.
+
+        Args:
+            blog_url: 블로그 URL
+            items: 이번에 받은 WordPress 항목 (필터링 전 전체)
+            current_ids: 서버에 현재 존재하는 전체 포스트 ID (알 수 있을 때만)
+        """
+        if blog_url not in self._previous:
+            previous = self.blogs.get(blog_url)
+            self._previous[blog_url] = dict(previous) if previous is not None else None
+        self.fetched.setdefault(blog_url, set()).update(
+            item["link"] for item in items if item.get("link")
+        )
+        state = self.blogs.setdefault(blog_url, {})
+        # 삭제 판단은 전체 동기화에서도 이전 실행까지 저장된 목록과 비교
+        known = dict(state.get("posts", {}))
+        posts = dict(known) if not self.full_resync else {}
+        newest_gmt = state.get("modified_gmt", "") if not self.full_resync else ""
+        newest_local = state.get("modified_after") if not self.full_resync else None
+
+        for item in items:
+            if "id" in item:
+                posts[str(item["id"])] = item.get("link", "")
+            modified_gmt = item.get("modified_gmt") or ""
+            if modified_gmt > newest_gmt:
+                newest_gmt = modified_gmt
+                # modified_after는 사이트 시간대로 해석되므로 modified 값을 함께 보관
+                newest_local = item.get("modified") or modified_gmt
+
+        if current_ids is not None:
+            removed = [post_id for post_id in known if post_id not in current_ids]
+            if removed:
+                self.deleted[blog_url] = [known[post_id] for post_id in removed]
+                for post_id in removed:
+                    posts.pop(post_id, None)
+                logger.info(f"삭제된 WordPress 포스트 {len(removed)}개 감지: {blog_url}")
+
+        state.update(
+            {
+                "modified_gmt": newest_gmt,
+                "modified_after": newest_local,
+                "posts": posts,
+                "synced_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            }
+        )
 
-            socket.setdefaulttimeout(REQUEST_TIMEOUT)
-            request = Request(url)
-            request.add_header("User-Agent", USER_AGENT)
-            request.add_header("Accept", "application/json")
+    def revert(self, links: Iterable[str]) -> List[str]:
+        """
+        links 중 하나라도 이번 실행에서 받은 블로그는 상태를 실행 전으로 되돌립니다.
+        포스트 쓰기에 실패한 블로그의 기준 시각을 올리지 않아 다음 실행에서 다시 받게 합니다.
+
+        Returns:
+            되돌린 블로그 URL 목록
+        """
+        links = set(links)
+        reverted = []
+        for blog_url, fetched in self.fetched.items():
+            if not fetched & links:
+                continue
+            previous = self._previous.get(blog_url)
+            if previous is None:
+                self.blogs.pop(blog_url, None)
+            else:
+                self.blogs[blog_url] = previous
+            reverted.append(blog_url)
+        return reverted
+
+    def save(self) -> None:
+        """
+        동기화 상태를 저장합니다.
+        기준 시각이 수집한 포스트를 지나가므로 포스트 파일을 모두 쓴 뒤에 호출합니다.
+        """
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 증분 기준의 확정 시점이므로 기본 fsync 정책으로 저장
+            atomic_write(
+                self.path, json.dumps(self.blogs, ensure_ascii=False, indent=2)
+            )
+        except OSError as e:
+            logger.warning(f"WordPress 동기화 상태 저장 실패: {e}")
 
-            with urlopen(request) as response:
-                data = json.loads(response.read().decode("utf-8"))
 
-            if not data:
-                break
+def classification_version() -> str:
+    """
+    현재 키워드 목록, 가중치, 분류 로직 버전을 나타내는 지문.
+    TECH_KEYWORDS나 EXCLUDE_KEYWORDS가 바뀌면 값이 달라져 분류 캐시가 무효화됩니다.
+    """
+    payload = json.dumps(
+        {
+            "classifier": CLASSIFIER_VERSION,
+            "terms": KEYWORD_SCORER.terms,
+            "weights": KEYWORD_SCORER.weights,
+            "title_weight": KEYWORD_SCORER.title_weight,
+            "body_weight": KEYWORD_SCORER.body_weight,
+        },
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
-            for item in data:
-                try:
-                    # 기본 정보 추출
-                    title = sanitize_html(item["title"]["rendered"])
-                    link = item["link"]
-
-                    if not validate_url(link):
-                        logger.warning(f"유효하지 않은 링크 URL: {link}")
-                        continue
-
-                    # 내용 추출
-                    content = item.get("content", {}).get("rendered", "")
-                    excerpt = item.get("excerpt", {}).get("rendered", "")
-
-                    # 기술 관련 포스트만 필터링
-                    if not is_tech_related(title, excerpt + " " + content):
-                        logger.debug(f"기술 관련이 아닌 포스트 제외: {title}")
-                        continue
-
-                    # 날짜 파싱
-                    published_date = None
-                    try:
-                        if item.get("date"):
-                            published_date = datetime.datetime.fromisoformat(
-                                item["date"].replace("Z", "+00:00")
-                            )
-                    except (ValueError, KeyError):
-                        pass
-
-                    post = {
-                        "title": title,
-                        "link": link,
-                        "description": sanitize_html(excerpt),
-                        "published": item.get("date", ""),
-                        "published_date": published_date,
-                        "content": content,
-                    }
-                    posts.append(post)
-
-                except Exception as e:
-                    logger.error(f"WordPress 포스트 처리 중 오류: {e}")
-                    continue
-
-            page += 1
-
-            # 너무 많은 페이지 방지 (최대 10페이지, 1000개 포스트)
-            if page > 10:
-                break
 
-        except HTTPError as e:
-            if e.code == 400:  # 더 이상 페이지 없음
-                break
-            logger.warning(f"WordPress API 오류: {e}")
-            break
+class ClassificationCache:
+    """
+    포스트 내용 해시 → 분류 결과(관련도 점수, 일치 키워드)를 실행 간에 보관합니다.
+
+    키는 제목과 일반 텍스트의 해시이고, 파일 전체에 classification_version()을
+    함께 저장하여 키워드나 가중치가 바뀌면 이전 결과를 모두 버립니다.
+    점수만 저장하므로 임계값(--tech-threshold)을 바꿔도 캐시를 그대로 씁니다.
+    저장할 때는 이번 실행에서 조회하거나 추가한 항목만 남겨, 수정되거나 사라진
+    포스트의 이전 해시가 쌓이지 않게 합니다.
+
+    Args:
+        path: 캐시 JSON 파일 경로 (None이면 파일 없이 메모리에서만 사용)
+    """
+
+    def __init__(self, path: Optional[str] = CLASSIFICATION_CACHE_FILE):
+        self.path = Path(path) if path else None
+        self.version = classification_version()
+        self.entries: Dict[str, List[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        # 이번 실행에서 조회되었거나 추가된 키
+        self._used: Set[str] = set()
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == self.version:
+                self.entries = data.get("entries", {})
+            else:
+                logger.info("키워드 설정이 바뀌어 분류 캐시를 새로 만듭니다.")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"분류 캐시를 읽을 수 없어 새로 만듭니다: {e}")
+
+    @staticmethod
+    def key(post: Dict[str, Any]) -> str:
+        """포스트 제목과 일반 텍스트의 해시"""
+        digest = hashlib.sha256(post["title"].encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(post_text(post).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[float, Set[str], Set[str]]]:
+        """(점수, 기술 키워드, 제외 키워드) 또는 None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.add(key)
+        score, tech_terms, exclude_terms = entry
+        return score, set(tech_terms), set(exclude_terms)
+
+    def put(
+        self, key: str, score: float, tech_terms: Set[str], exclude_terms: Set[str]
+    ) -> None:
+        self.entries[key] = [score, sorted(tech_terms), sorted(exclude_terms)]
+        self._used.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        변경된 경우에만 캐시 파일을 저장합니다.
+        이번 실행에서 쓰이지 않은 항목은 버립니다. (아무 포스트도 분류하지 않은
+        실행, 예를 들어 수집이 모두 실패한 경우에는 캐시를 그대로 둡니다.)
+        """
+        if self._used and len(self.entries) > len(self._used):
+            self.entries = {
+                key: entry for key, entry in self.entries.items() if key in self._used
+            }
+            self._dirty = True
+        if not self._dirty or self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(
+                self.path,
+                json.dumps(
+                    {"version": self.version, "entries": self.entries},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                ),
+                fsync=FSYNC_NONE,
+            )
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"분류 캐시 저장 실패: {e}")
+
+
+class FilterTelemetry:
+    """
+    키워드 필터 통계를 모읍니다.
+
+    - 키워드별로 일치한 포스트 수, 그중 포함/제외된 포스트 수
+    - 판정 결과별 포스트 수 (included, excluded, below_threshold, no_match)
+    - 포스트별 키워드 매칭 시간 (분류 캐시에서 가져온 포스트는 제외)
+
+    실행이 끝나면 report()/save()로 JSON 보고서를 만들어
+    한 번도 일치하지 않는 키워드나 너무 넓게 잡히는 키워드를 찾는 데 씁니다.
+    """
+
+    DECISIONS = ("included", "excluded", "below_threshold", "no_match")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.keywords: Dict[str, Dict[str, int]] = {}
+        self.decisions = {decision: 0 for decision in self.DECISIONS}
+        self.match_times: List[float] = []
+        self.cached = 0
+
+    def record(self, result: Dict[str, Any], elapsed: Optional[float]) -> None:
+        """
+        포스트 하나의 분류 결과를 기록합니다.
+
+        Args:
+            result: classify_batch 결과 항목
+            elapsed: 키워드 매칭 시간 (초, 캐시에서 가져왔으면 None)
+        """
+        if result["tech"]:
+            decision = "included"
+        elif result["exclude_terms"]:
+            decision = "excluded"
+        elif result["tech_terms"]:
+            decision = "below_threshold"
+        else:
+            decision = "no_match"
+        self.decisions[decision] += 1
+
+        for term in result["tech_terms"] | result["exclude_terms"]:
+            counters = self.keywords.setdefault(
+                term, {"hits": 0, "included": 0, "excluded": 0}
+            )
+            counters["hits"] += 1
+            if decision in ("included", "excluded"):
+                counters[decision] += 1
+
+        if elapsed is None:
+            self.cached += 1
+        else:
+            self.match_times.append(elapsed)
+
+    def report(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 보고서 딕셔너리"""
+        times = sorted(self.match_times)
+
+        def percentile(fraction: float) -> float:
+            if not times:
+                return 0.0
+            return times[min(int(len(times) * fraction), len(times) - 1)]
+
+        keywords = {}
+        for term in sorted(self.keywords, key=lambda t: (-self.keywords[t]["hits"], t)):
+            keywords[term] = {
+                "type": "exclude" if term in _EXCLUDE_TERMS else "tech",
+                **self.keywords[term],
+            }
+
+        return {
+            "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "classification_version": classification_version(),
+            "threshold": KEYWORD_SCORER.threshold,
+            "posts": sum(self.decisions.values()),
+            "cached_posts": self.cached,
+            "decisions": dict(self.decisions),
+            "match_time_ms": {
+                "count": len(times),
+                "total": round(sum(times) * 1000, 3),
+                "mean": round(sum(times) / len(times) * 1000, 4) if times else 0.0,
+                "p50": round(percentile(0.5) * 1000, 4),
+                "p95": round(percentile(0.95) * 1000, 4),
+                "max": round(times[-1] * 1000, 4) if times else 0.0,
+            },
+            "keywords": keywords,
+            # 이번 실행에서 한 번도 일치하지 않은 키워드 (정리 후보)
+            "unused_keywords": sorted(
+                (_TECH_TERMS | _EXCLUDE_TERMS) - self.keywords.keys()
+            ),
+        }
+
+    def save(self, path: str) -> None:
+        """보고서를 JSON 파일로 저장합니다."""
+        report_path = Path(path)
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(
+                report_path,
+                json.dumps(self.report(), ensure_ascii=False, indent=2),
+                fsync=FSYNC_NONE,
+            )
+            logger.info(f"키워드 필터 보고서 저장: {report_path}")
+        except OSError as e:
+            logger.warning(f"키워드 필터 보고서 저장 실패: {e}")
+
+
+# 실행 중 모든 분류 결과가 기록되는 필터 통계
+FILTER_TELEMETRY = FilterTelemetry()
+
+
+async def _fetch_wordpress_pages(
+    fetcher: FeedFetcher, base_url: str
+) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+    """
+    WordPress REST 목록의 모든 페이지를 가져와 항목을 합칩니다.
+    첫 페이지의 X-WP-TotalPages 헤더로 전체 페이지 수를 알아낸 뒤
+    나머지 페이지를 동시에 요청합니다. 페이지 수 상한은 두지 않습니다.
+
+    Returns:
+        (항목 리스트, 모든 페이지를 받았는지 여부) 튜플. 첫 페이지부터 실패하면 None
+    """
+    try:
+        first_page, headers = await fetcher.fetch_json(f"{base_url}&page=1")
+    except FetchError as e:
+        logger.warning(f"WordPress API 오류: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"WordPress API 수집 중 오류: {e}")
+        return None
+
+    try:
+        total_pages = int(headers.get("x-wp-totalpages", "1"))
+    except ValueError:
+        total_pages = 1
+    if headers.get("x-wp-total"):
+        logger.info(
+            f"WordPress 포스트 {headers['x-wp-total']}개, {total_pages}페이지"
+        )
+
+    pages = [first_page]
+    complete = True
+    if total_pages > 1:
+        results = await asyncio.gather(
+            *(
+                fetcher.fetch_json(f"{base_url}&page={page}")
+                for page in range(2, total_pages + 1)
+            ),
+            return_exceptions=True,
+        )
+        for page, result in enumerate(results, 2):
+            if isinstance(result, BaseException):
+                logger.warning(f"WordPress API {page}페이지 수집 실패: {result}")
+                complete = False
+                continue
+            pages.append(result[0])
+
+    items = []
+    for data in pages:
+        if isinstance(data, list):
+            items.extend(item for item in data if isinstance(item, dict))
+    return items, complete
+
+
+async def fetch_wordpress_posts(
+    blog_url: str,
+    fetcher: FeedFetcher,
+    sync_state: Optional[WordPressSyncState] = None,
+    detect_deletions: bool = False,
+    classification_cache: Optional[ClassificationCache] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    WordPress REST API를 사용하여 포스트 목록을 가져옵니다.
+    IT, DevSecOps, 코딩 관련 포스트만 필터링합니다.
+
+    Args:
+        blog_url: 블로그 URL
+        fetcher: 공통 피드 수집 엔진
+        sync_state: 증분 동기화 상태 (있으면 새 글/수정된 글만 요청)
+        detect_deletions: 증분 동기화 중에도 ID 목록을 받아 삭제된 글을 확인
+        classification_cache: 실행 간 분류 결과 캐시
+
+    Returns:
+        포스트 리스트. API 요청 자체가 실패하면 None
+    """
+    api_url = f"{blog_url}/wp-json/wp/v2/posts"
+    logger.info(f"WordPress API 수집 중: {api_url}")
+
+    base_url = f"{api_url}?per_page={WORDPRESS_PER_PAGE}&_fields={WORDPRESS_FIELDS}"
+    modified_after = sync_state.modified_after(blog_url) if sync_state else None
+    if modified_after:
+        logger.info(f"WordPress 증분 동기화: {modified_after} 이후 수정된 포스트만 요청")
+        base_url += f"&modified_after={quote(modified_after)}"
+
+    fetched = await _fetch_wordpress_pages(fetcher, base_url)
+    if fetched is None:
+        return None
+    items, complete = fetched
+
+    if sync_state and not complete:
+        # 일부 페이지가 빠졌으면 기준 시각을 올리지 않아 다음 실행에서 다시 받음
+        logger.warning(f"WordPress 페이지 일부 누락, 동기화 상태를 갱신하지 않음: {blog_url}")
+    elif sync_state:
+        current_ids = None
+        if not modified_after:
+            # 전체 목록을 받았으므로 여기에 없는 ID는 삭제된 글
+            current_ids = {str(item["id"]) for item in items if "id" in item}
+        elif detect_deletions and sync_state.known_posts(blog_url):
+            id_pages = await _fetch_wordpress_pages(
+                fetcher, f"{api_url}?per_page={WORDPRESS_PER_PAGE}&_fields=id"
+            )
+            if id_pages is not None and id_pages[1]:
+                current_ids = {str(item["id"]) for item in id_pages[0] if "id" in item}
+        sync_state.update(blog_url, items, current_ids)
+
+    posts = []
+    for item in items:
+        try:
+            post = _wordpress_item_to_post(item)
+            if post:
+                posts.append(post)
         except Exception as e:
-            logger.error(f"WordPress API 수집 중 오류: {e}")
-            break
+            logger.error(f"WordPress 포스트 처리 중 오류: {e}")
+            continue
 
+    # 기술 관련 포스트만 필터링
+    posts = filter_tech_posts(posts, classification_cache)
     logger.info(f"{len(posts)}개의 WordPress 포스트 수집 완료")
     return posts
 
@@ -327,6 +996,7 @@ def fetch_wordpress_posts(blog_url: str) -> List[Dict[str, Any]]:
 def is_tech_related(title: str, description: str = "") -> bool:
     """
     포스트가 IT, DevSecOps, 코딩 관련인지 확인합니다.
+    관련도 점수가 KEYWORD_SCORER.threshold 이상이면 기술 관련으로 판단합니다.
 
     Args:
         title: 포스트 제목
@@ -335,90 +1005,228 @@ def is_tech_related(title: str, description: str = "") -> bool:
     Returns:
         기술 관련이면 True, 그렇지 않으면 False
     """
-    # 제외 키워드 확인
-    combined_text = (title + " " + description).lower()
-    for exclude_keyword in EXCLUDE_KEYWORDS:
-        if exclude_keyword.lower() in combined_text:
-            logger.debug(f"제외 키워드 발견: {exclude_keyword} in '{title}'")
-            return False
+    result = classify_batch([{"title": title, "description": description}])[0]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"관련도 {result['score']:.1f}: 기술 {sorted(result['tech_terms'])}, "
+            f"제외 {sorted(result['exclude_terms'])} in '{title}'"
+        )
+    return result["tech"]
 
-    # 기술 키워드 확인
-    for keyword in TECH_KEYWORDS:
-        if keyword.lower() in combined_text:
-            logger.debug(f"기술 키워드 발견: {keyword} in '{title}'")
-            return True
 
-    return False
+def classify_batch(
+    posts: List[Dict[str, Any]], cache: Optional[ClassificationCache] = None
+) -> List[Dict[str, Any]]:
+    """
+    여러 포스트를 한 번에 분류합니다.
+    포스트마다 제목과 본문 텍스트(post_text)를 한 번씩 토큰화하여 전체 키워드 색인과 비교하고,
+    묶음 전체의 관련도 점수를 한 번에 계산합니다.
+    캐시가 있으면 내용이 바뀌지 않은 포스트는 다시 분류하지 않습니다.
 
+    Args:
+        posts: title과 text(또는 description, content) 키를 가진 포스트 리스트
+        cache: 실행 간 분류 결과 캐시
 
-def fetch_blog_posts(blog_url: str) -> List[Dict[str, Any]]:
+    Returns:
+        포스트 순서대로 {"tech": 기술 관련 여부, "score": 관련도 점수,
+        "tech_terms": 기술 키워드, "exclude_terms": 제외 키워드} 딕셔너리 리스트
     """
-    블로그 RSS 피드에서 포스트 목록을 가져옵니다.
-    IT, DevSecOps, 코딩 관련 포스트만 필터링합니다.
+    cached: List[Optional[Tuple[float, Set[str], Set[str]]]] = [None] * len(posts)
+    keys: List[Optional[str]] = [None] * len(posts)
+    if cache is not None:
+        for i, post in enumerate(posts):
+            keys[i] = cache.key(post)
+            cached[i] = cache.get(keys[i])
+
+    pending = [i for i, entry in enumerate(cached) if entry is None]
+    match_times: Dict[int, float] = {}
+    if pending:
+        matches = []
+        for i in pending:
+            started = time.perf_counter()
+            document = (posts[i]["title"], post_text(posts[i]))
+            matches.extend(KEYWORD_SCORER.match([document]))
+            match_times[i] = time.perf_counter() - started
+        scores = KEYWORD_SCORER.score_matches(matches)
+        for i, (title_hits, body_hits), score in zip(pending, matches, scores):
+            hits = title_hits | body_hits
+            cached[i] = (score, hits & _TECH_TERMS, hits & _EXCLUDE_TERMS)
+            if cache is not None:
+                cache.put(keys[i], *cached[i])
+
+    results = []
+    for i, (score, tech_terms, exclude_terms) in enumerate(cached):
+        result = {
+            "tech": score >= KEYWORD_SCORER.threshold,
+            "score": score,
+            "tech_terms": tech_terms,
+            "exclude_terms": exclude_terms,
+        }
+        FILTER_TELEMETRY.record(result, match_times.get(i))
+        results.append(result)
+    return results
+
+
+def filter_tech_posts(
+    posts: List[Dict[str, Any]], cache: Optional[ClassificationCache] = None
+) -> List[Dict[str, Any]]:
     """
-    if not validate_url(blog_url):
-        logger.error(f"유효하지 않은 URL: {blog_url}")
-        return []
+    classify_batch 결과로 기술 관련 포스트만 남깁니다.
+    남은 포스트에는 정렬 등에 쓸 수 있도록 관련도 점수(relevance)를 기록합니다.
+    """
+    kept = []
+    for post, result in zip(posts, classify_batch(posts, cache)):
+        if result["tech"]:
+            post["relevance"] = result["score"]
+            # 태그/카테고리 추론에 다시 쓰도록 필터링 때 찾은 키워드를 보관
+            post["tech_terms"] = sorted(result["tech_terms"])
+            kept.append(post)
+        else:
+            logger.debug(
+                f"기술 관련이 아닌 포스트 제외 (관련도 {result['score']:.1f}): "
+                f"{post['title']}"
+            )
+    return kept
 
-    # 다양한 RSS 피드 경로 시도
-    rss_paths = ["/rss", "/feed", "/rss.xml", "/feed.xml", "/atom.xml"]
-    rss_url = None
-    feed = None
 
-    for path in rss_paths:
-        try_url = f"{blog_url}{path}"
-        logger.debug(f"RSS 피드 시도 중: {try_url}")
+# 홈페이지에 피드 링크가 없을 때 시도할 RSS 피드 경로
+RSS_PATHS = ["/rss", "/feed", "/rss.xml", "/feed.xml", "/atom.xml"]
 
-        # 재시도 로직
-        for attempt in range(MAX_RETRIES):
-            try:
-                socket.setdefaulttimeout(REQUEST_TIMEOUT)
-                request = Request(try_url)
-                request.add_header("User-Agent", USER_AGENT)
-                request.add_header(
-                    "Accept", "application/rss+xml, application/xml, text/xml"
-                )
 
-                temp_feed = feedparser.parse(try_url)
+async def _homepage_feed_links(blog_url: str, fetcher: FeedFetcher) -> List[str]:
+    """홈페이지의 <link rel="alternate">에서 같은 블로그의 피드 주소를 찾습니다."""
+    try:
+        body, headers = await fetcher.fetch_bytes(blog_url, "text/html", max_retries=1)
+    except FetchError as e:
+        logger.debug(f"홈페이지 수집 실패: {e}")
+        return []
+    charset = "utf-8"
+    content_type = headers.get("content-type", "")
+    if "charset=" in content_type:
+        charset = content_type.split("charset=")[-1].split(";")[0].strip() or charset
+    try:
+        html_text = body.decode(charset, errors="replace")
+    except LookupError:
+        html_text = body.decode("utf-8", errors="replace")
+    # 다른 도메인을 가리키는 링크는 화이트리스트 검증으로 걸러냄
+    return [
+        url
+        for url in find_feed_links(html_text, blog_url)
+        if urlparse(url).netloc == urlparse(blog_url).netloc and validate_url(url)
+    ]
+
 
-                if temp_feed.bozo and temp_feed.bozo_exception:
-                    logger.debug(f"RSS 피드 파싱 오류: {temp_feed.bozo_exception}")
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY)
-                        continue
-                    break  # 다음 경로 시도
+async def _probe_feed(try_url: str, fetcher: FeedFetcher) -> Optional[Any]:
+    """후보 피드 URL을 한 번만 시도하고, 항목이 있는 피드면 반환합니다."""
+    logger.debug(f"RSS 피드 시도 중: {try_url}")
+    try:
+        feed = await fetcher.fetch_feed(try_url, max_retries=1)
+    except FetchError as e:
+        logger.debug(f"RSS 피드 수집 실패: {e}")
+        return None
+    except Exception as e:
+        logger.debug(f"예상치 못한 오류: {e}")
+        return None
+    return feed if feed.get("entries") else None
 
-                if temp_feed.get("entries"):
-                    rss_url = try_url
-                    feed = temp_feed
-                    logger.info(f"RSS 피드 발견: {rss_url}")
-                    break
 
-                break  # 다음 경로 시도
+async def discover_feed(
+    blog_url: str, fetcher: FeedFetcher
+) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    블로그의 RSS/Atom 피드를 탐색합니다.
+    홈페이지와 모든 후보 경로를 동시에 요청하므로 콜드 스타트 비용은 대략 왕복 한 번입니다.
+    여러 후보가 성공하면 홈페이지가 알려준 피드 링크, RSS_PATHS 순서로 우선하며,
+    우선순위가 높은 후보가 모두 실패한 것이 확인되는 즉시 결과를 반환하고
+    남은 요청은 취소합니다.
 
-            except (URLError, HTTPError) as e:
-                logger.debug(f"네트워크 오류: {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
-                    continue
-                break
-            except socket.timeout:
-                logger.debug(f"타임아웃 오류")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
-                    continue
-                break
-            except Exception as e:
-                logger.debug(f"예상치 못한 오류: {e}")
-                break
+    Returns:
+        (파싱된 피드, 피드 URL) 튜플. 찾지 못하면 (None, None)
+    """
+    path_urls = [f"{blog_url}{path}" for path in RSS_PATHS]
+    probes = {url: asyncio.create_task(_probe_feed(url, fetcher)) for url in path_urls}
+    homepage = asyncio.create_task(_homepage_feed_links(blog_url, fetcher))
+
+    try:
+        links = await homepage
+        for url in links:
+            if url not in probes:
+                probes[url] = asyncio.create_task(_probe_feed(url, fetcher))
+
+        for try_url in links + [url for url in path_urls if url not in links]:
+            feed = await probes[try_url]
+            if feed:
+                logger.info(f"RSS 피드 발견: {try_url}")
+                return feed, try_url
+        return None, None
+    finally:
+        homepage.cancel()
+        for task in probes.values():
+            task.cancel()
+
+
+async def fetch_blog_posts(
+    blog_url: str,
+    fetcher: FeedFetcher,
+    discovery: Optional[FeedDiscoveryCache] = None,
+    sync_state: Optional[WordPressSyncState] = None,
+    detect_deletions: bool = False,
+    classification_cache: Optional[ClassificationCache] = None,
+) -> List[Dict[str, Any]]:
+    """
+    블로그 RSS 피드에서 포스트 목록을 가져옵니다.
+    IT, DevSecOps, 코딩 관련 포스트만 필터링합니다.
+
+    Args:
+        blog_url: 블로그 URL
+        fetcher: 공통 피드 수집 엔진
+        discovery: 블로그별 피드 엔드포인트 캐시 (None이면 매번 탐색)
+        sync_state: WordPress 증분 동기화 상태
+        detect_deletions: WordPress 삭제 글 확인 여부
+        classification_cache: 실행 간 분류 결과 캐시
+    """
+    if not validate_url(blog_url):
+        logger.error(f"유효하지 않은 URL: {blog_url}")
+        return []
 
-        if feed and feed.get("entries"):
-            break
+    feed = None
+    endpoint = discovery.get(blog_url) if discovery else None
 
-    if not feed or not feed.get("entries"):
-        logger.info(f"RSS 피드를 찾을 수 없음. WordPress API 시도: {blog_url}")
-        # WordPress REST API 시도
-        return fetch_wordpress_posts(blog_url)
+    # 1) 이전 실행에서 동작한 엔드포인트를 바로 사용
+    if endpoint and endpoint.get("kind") == "wordpress":
+        posts = await fetch_wordpress_posts(
+            blog_url, fetcher, sync_state, detect_deletions, classification_cache
+        )
+        if posts is not None:
+            return posts
+        discovery.invalidate(blog_url)
+    elif endpoint and endpoint.get("kind") == "rss":
+        try:
+            feed = await fetcher.fetch_feed(endpoint["url"])
+        except FetchError as e:
+            logger.debug(f"캐시된 RSS 피드 수집 실패: {e}")
+        if not feed or not feed.get("entries"):
+            feed = None
+            discovery.invalidate(blog_url)
+
+    # 2) 캐시가 없거나 실패했으면 다시 탐색
+    if feed is None:
+        feed, feed_url = await discover_feed(blog_url, fetcher)
+        if feed is None:
+            logger.info(f"RSS 피드를 찾을 수 없음. WordPress API 시도: {blog_url}")
+            # WordPress REST API 시도
+            posts = await fetch_wordpress_posts(
+                blog_url, fetcher, sync_state, detect_deletions, classification_cache
+            )
+            if posts is None:
+                return []
+            if discovery:
+                discovery.record(
+                    blog_url, "wordpress", f"{blog_url}/wp-json/wp/v2/posts"
+                )
+            return posts
+        if discovery:
+            discovery.record(blog_url, "rss", feed_url)
 
     # 포스트 추출 및 필터링
     posts = []
@@ -436,11 +1244,6 @@ def fetch_blog_posts(blog_url: str) -> List[Dict[str, Any]]:
                 logger.warning(f"유효하지 않은 링크 URL: {link}")
                 continue
 
-            # 기술 관련 포스트만 필터링
-            if not is_tech_related(title, description):
-                logger.debug(f"기술 관련이 아닌 포스트 제외: {title}")
-                continue
-
             # 날짜 파싱
             published_date = None
             try:
@@ -451,15 +1254,20 @@ def fetch_blog_posts(blog_url: str) -> List[Dict[str, Any]]:
             except (ValueError, KeyError):
                 pass
 
+            content = (
+                entry.get("content", [{}])[0].get("value", "")
+                if entry.get("content")
+                else ""
+            )
             post = {
                 "title": title,
                 "link": link,
                 "description": sanitize_html(description),
                 "published": entry.get("published", ""),
                 "published_date": published_date,
-                "content": entry.get("content", [{}])[0].get("value", "")
-                if entry.get("content")
-                else "",
+                "content": content,
+                # 필터링·요약에 재사용할 일반 텍스트 (HTML은 여기서 한 번만 변환)
+                "text": html_to_text(content or description),
             }
             posts.append(post)
 
@@ -467,67 +1275,703 @@ def fetch_blog_posts(blog_url: str) -> List[Dict[str, Any]]:
             logger.error(f"포스트 처리 중 오류 발생: {e}")
             continue
 
+    # 기술 관련 포스트만 필터링
+    posts = filter_tech_posts(posts, classification_cache)
     logger.info(f"{len(posts)}개의 기술 관련 포스트 수집 완료")
     return posts
 
 
-def create_jekyll_post(post: Dict[str, Any], output_dir: Path) -> Optional[str]:
+async def _timed_fetch(
+    blog_url: str,
+    fetcher: FeedFetcher,
+    discovery: FeedDiscoveryCache,
+    sync_state: WordPressSyncState,
+    detect_deletions: bool,
+    classification_cache: Optional[ClassificationCache],
+) -> Dict[str, Any]:
     """
-    Jekyll 포스트 파일을 생성합니다.
+    블로그 하나를 수집하고 소요 시간을 함께 반환합니다.
+    전체 시간 예산이 끝나면 수집을 취소하고 stale로 표시합니다.
+    """
+    started = time.perf_counter()
+    stale = False
+    try:
+        posts = await asyncio.wait_for(
+            fetch_blog_posts(
+                blog_url,
+                fetcher,
+                discovery,
+                sync_state,
+                detect_deletions,
+                classification_cache,
+            ),
+            timeout=fetcher.deadline.remaining(),
+        )
+    except asyncio.TimeoutError:
+        posts = []
+        stale = True
+    except Exception as e:
+        logger.error(f"블로그 수집 중 오류: {blog_url}: {e}")
+        posts = []
+    # 예산이 끝난 뒤에 돌아온 결과는 일부 요청이 잘렸을 수 있음
+    stale = stale or fetcher.deadline.expired
+    return {
+        "blog_url": blog_url,
+        "posts": posts,
+        "stale": stale,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+async def _collect(
+    blog_urls: List[str],
+    fetcher: FeedFetcher,
+    sync_state: WordPressSyncState,
+    discovery: FeedDiscoveryCache,
+    detect_deletions: bool,
+    classification_cache: Optional[ClassificationCache],
+) -> List[Dict[str, Any]]:
+    try:
+        # gather는 입력 순서대로 결과를 돌려주므로 병합 순서가 결정적입니다.
+        results = await asyncio.gather(
+            *(
+                _timed_fetch(
+                    blog_url,
+                    fetcher,
+                    discovery,
+                    sync_state,
+                    detect_deletions,
+                    classification_cache,
+                )
+                for blog_url in blog_urls
+            )
+        )
+    finally:
+        fetcher.close()
+    # 동기화 상태는 포스트를 쓴 뒤 호출한 쪽에서 저장
+    discovery.save()
+    if classification_cache is not None:
+        classification_cache.save()
+    return results
+
+
+def collect_blog_posts(
+    blog_urls: List[str],
+    workers: int = DEFAULT_FETCH_WORKERS,
+    use_cache: bool = True,
+    full_resync: bool = False,
+    detect_deletions: bool = False,
+    deadline: Optional[float] = COLLECT_DEADLINE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = REQUEST_TIMEOUT,
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
+    replay_realtime: bool = False,
+    use_classification_cache: bool = True,
+    filter_report: Optional[str] = FILTER_REPORT_FILE,
+    sync_state: Optional[WordPressSyncState] = None,
+    discovery: Optional[FeedDiscoveryCache] = None,
+) -> Tuple[List[Dict[str, Any]], WordPressSyncState]:
+    """
+    여러 블로그에서 포스트를 동시에 수집합니다.
+    가장 느린 피드 하나가 전체 수집 시간을 결정하도록 공통 비동기 수집 엔진으로
+    모든 블로그를 함께 처리하며, 결과는 blog_urls 순서대로 병합됩니다.
+    시간 예산이 끝나면 그때까지 모은 포스트로 계속 진행하고,
+    끝내지 못한 블로그는 stale로 보고합니다.
+
+    Args:
+        blog_urls: 수집할 블로그 URL 목록
+        workers: 동시에 진행할 최대 HTTP 요청 수 (1이면 순차 수집)
+        use_cache: ETag/Last-Modified 조건부 요청 캐시 사용 여부
+        full_resync: WordPress 증분 동기화 기준을 무시하고 전체를 다시 수집
+        detect_deletions: WordPress에서 삭제된 글을 확인 (ID 목록 추가 요청)
+        deadline: 수집 단계 전체 시간 예산 (초, None이면 제한 없음)
+        connect_timeout: 기본 연결 타임아웃 (초)
+        read_timeout: 기본 읽기 타임아웃 (초)
+        record_dir: 모든 HTTP 응답을 기록할 아카이브 디렉토리
+        replay_dir: 네트워크 대신 응답을 재생할 아카이브 디렉토리
+        replay_realtime: 재생 시 기록된 응답 시간만큼 기다림
+        use_classification_cache: 내용이 바뀌지 않은 포스트의 분류 결과 재사용 여부
+        filter_report: 키워드 필터 통계 JSON 보고서 경로 (None이면 저장하지 않음)
+        sync_state: WordPress 증분 동기화 상태 (없으면 기본 경로의 상태 파일 사용)
+        discovery: 피드 탐색 캐시 (없으면 기본 경로의 캐시 파일 사용)
+
+    Returns:
+        (병합된 포스트 리스트, 갱신된 WordPress 동기화 상태).
+        동기화 상태는 저장하지 않으므로 포스트를 쓴 뒤 호출한 쪽에서 save()합니다.
+    """
+    started = time.perf_counter()
+    client_options = {"connect_timeout": connect_timeout, "read_timeout": read_timeout}
+    if replay_dir:
+        client = ReplayHttpClient(
+            HttpArchive(replay_dir), realtime=replay_realtime, **client_options
+        )
+    elif record_dir:
+        client = RecordingHttpClient(HttpArchive(record_dir), **client_options)
+    else:
+        client = HttpClient(**client_options)
+
+    archived = bool(record_dir or replay_dir)
+    # 기록/재생은 항상 같은 요청 순서를 내도록 로컬 캐시와 증분 상태를 쓰지 않음
+    if sync_state is None:
+        if archived:
+            sync_state = WordPressSyncState(path=None, full_resync=True)
+        else:
+            sync_state = WordPressSyncState(full_resync=full_resync)
+    if discovery is None:
+        discovery = FeedDiscoveryCache(path=None) if archived else FeedDiscoveryCache()
+    fetcher = FeedFetcher(
+        concurrency=workers,
+        timeout=read_timeout,
+        cache=HttpCache() if use_cache and not archived else None,
+        client=client,
+        deadline=Deadline(deadline),
+    )
+    classification_cache = ClassificationCache() if use_classification_cache else None
+    FILTER_TELEMETRY.reset()
+    results = asyncio.run(
+        _collect(
+            blog_urls,
+            fetcher,
+            sync_state,
+            discovery,
+            detect_deletions,
+            classification_cache,
+        )
+    )
+    if classification_cache is not None:
+        logger.info(
+            f"분류 캐시: {classification_cache.hits}개 재사용, "
+            f"{classification_cache.misses}개 새로 분류"
+        )
+    decisions = FILTER_TELEMETRY.decisions
+    logger.info(
+        f"키워드 필터: 포함 {decisions['included']}개, 제외 {decisions['excluded']}개, "
+        f"점수 미달 {decisions['below_threshold']}개, 일치 없음 {decisions['no_match']}개"
+    )
+    if filter_report:
+        FILTER_TELEMETRY.save(filter_report)
+    for blog_url, links in sync_state.deleted.items():
+        for link in links:
+            logger.info(f"  → {blog_url}: 삭제된 포스트 {link}")
+
+    all_posts = []
+    for result in results:
+        posts = result["posts"]
+        if result["stale"]:
+            logger.warning(
+                f"  → {result['blog_url']}: 시간 예산 초과로 수집이 끝나지 않음 (stale, "
+                f"{len(posts)}개 사용, {result['elapsed']:.2f}초)"
+            )
+            all_posts.extend(posts)
+        elif posts:
+            logger.info(
+                f"  → {result['blog_url']}: {len(posts)}개의 기술 관련 포스트 수집 "
+                f"({result['elapsed']:.2f}초)"
+            )
+            all_posts.extend(posts)
+        else:
+            logger.warning(
+                f"  → {result['blog_url']}: 수집된 포스트 없음 ({result['elapsed']:.2f}초)"
+            )
+
+    logger.info(f"블로그 수집 완료: 총 {time.perf_counter() - started:.2f}초")
+    return all_posts, sync_state
+
+
+# 키워드 → (카테고리, 카테고리 순서). 분류표에 없는 키워드는 기본 카테고리로 맨 뒤에 둠
+_TERM_CATEGORY = {
+    keyword: (category, rank)
+    for rank, (category, keywords) in enumerate(KEYWORD_CATEGORIES.items())
+    for keyword in keywords
+}
+_DEFAULT_TERM_CATEGORY = (DEFAULT_CATEGORY, len(KEYWORD_CATEGORIES))
+
+
+def infer_taxonomy(post: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """
+    필터링 단계에서 찾은 기술 키워드(post["tech_terms"])로 카테고리와 태그를 정합니다.
+    본문을 다시 검사하지 않으며, 키워드가 저장되어 있지 않은 포스트만 한 번 분류합니다.
 
     Args:
         post: 포스트 정보 딕셔너리
-        output_dir: 출력 디렉토리
 
     Returns:
-        생성된 파일 경로 또는 None
+        (카테고리 리스트, 태그 리스트) 튜플
+    """
+    terms = post.get("tech_terms")
+    if terms is None:
+        terms = sorted(classify_batch([post])[0]["tech_terms"])
+
+    # 카테고리: 일치한 키워드가 많은 순 (같으면 KEYWORD_CATEGORIES 순서)
+    counts: Dict[str, int] = {}
+    ranks: Dict[str, int] = {}
+    for term in terms:
+        category, rank = _TERM_CATEGORY.get(term, _DEFAULT_TERM_CATEGORY)
+        counts[category] = counts.get(category, 0) + 1
+        ranks[category] = rank
+    categories = sorted(counts, key=lambda name: (-counts[name], ranks[name]))
+    categories = categories[:MAX_CATEGORIES] or [DEFAULT_CATEGORY]
+
+    # 태그: 일반 단어와 겹쳐 가중치를 낮춘 키워드("it", "go" 등)는 태그로 쓰지 않음
+    tags: List[str] = []
+    ordered = sorted(
+        terms, key=lambda term: (_TERM_CATEGORY.get(term, _DEFAULT_TERM_CATEGORY)[1], term)
+    )
+    for term in ordered:
+        if KEYWORD_WEIGHTS.get(term, 1.0) < 1.0:
+            continue
+        tag = TAG_ALIASES.get(term, term)
+        if tag not in tags:
+            tags.append(tag)
+    return categories, tags[:MAX_TAGS]
+
+
+# 포스트 렌더링 프로세스 수, 파일 쓰기 스레드 수
+RENDER_WORKERS = os.cpu_count() or 1
+WRITE_WORKERS = 8
+# 이보다 포스트가 적으면 렌더링 프로세스 풀을 띄우지 않음
+PARALLEL_RENDER_MIN_POSTS = 500
+
+# 출력 저장소에 두는 포스트 목록 (Jekyll은 점으로 시작하는 파일을 빌드하지 않음)
+POST_MANIFEST_FILE = ".post-manifest.json"
+POST_MANIFEST_VERSION = 1
+# front matter를 찾을 때 한 번에 읽는 크기와 최대 크기 (본문은 읽지 않음)
+FRONT_MATTER_READ_SIZE = 4096
+FRONT_MATTER_MAX_SIZE = 64 * 1024
+# front matter 구분선: "---"만 있는 줄 ("----", "---foo"는 구분선이 아님)
+_FRONT_MATTER_OPEN = re.compile(rb"---\r?\n")
+_FRONT_MATTER_CLOSE = re.compile(rb"\n---\r?\n")
+
+
+def read_front_matter(path: Path) -> Dict[str, str]:
+    """
+    포스트 파일 앞부분의 front matter만 읽어 최상위 키: 값 사전을 만듭니다.
+    닫는 --- 를 찾을 때까지만 읽으므로 본문 크기와 관계없이 빠릅니다.
+
+    Args:
+        path: 포스트 파일 경로
+
+    Returns:
+        키 → 값 (따옴표 제거). front matter가 없으면 빈 사전
+    """
+    with open(path, "rb") as f:
+        header = f.read(FRONT_MATTER_READ_SIZE)
+        opening = _FRONT_MATTER_OPEN.match(header)
+        if not opening:
+            return {}
+        start = opening.end()
+        while True:
+            # 여는 줄의 줄바꿈부터 찾아야 front matter가 비어 있는 경우도 처리됨
+            closing = _FRONT_MATTER_CLOSE.search(header, start - 1)
+            if closing:
+                end = closing.start()
+                break
+            chunk = f.read(FRONT_MATTER_READ_SIZE)
+            if not chunk:
+                # 파일이 닫는 구분선으로 끝나는 경우
+                if header.endswith((b"\n---", b"\n---\r")):
+                    end = header.rindex(b"\n---")
+                    break
+                return {}
+            if len(header) >= FRONT_MATTER_MAX_SIZE:
+                return {}
+            header += chunk
+
+    fields = {}
+    for line in header[start:end].decode("utf-8", "replace").splitlines():
+        key, separator, value = line.partition(":")
+        if not separator or not key or key[0].isspace():
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        fields[key.strip()] = value
+    return fields
+
+
+def _parse_post_date(value: str, filename: str) -> Optional[datetime.datetime]:
+    """front matter 날짜, 없으면 파일명 앞의 YYYY-MM-DD"""
+    for text, date_format in (
+        (value, "%Y-%m-%d %H:%M:%S %z"),
+        (value, "%Y-%m-%d %H:%M:%S"),
+        (value, "%Y-%m-%d"),
+        (filename[:10], "%Y-%m-%d"),
+    ):
+        try:
+            return datetime.datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _scan_post(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        fields = read_front_matter(path)
+    except OSError as e:
+        logger.warning(f"포스트를 읽을 수 없습니다: {path}: {e}")
+        return None
+    return {
+        "path": path,
+        "original_url": fields.get("original_url", ""),
+        "title": fields.get("title", ""),
+        "date": _parse_post_date(fields.get("date", ""), path.name),
+    }
+
+
+def scan_posts(
+    directory: Path, workers: int = WRITE_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    포스트 디렉토리의 모든 .md 파일에서 front matter(original_url, date, title)를
+    병렬로 읽습니다. 포스트 목록이 없는 기존 저장소를 증분 생성으로 옮길 때 씁니다.
+
+    Args:
+        directory: 포스트 디렉토리
+        workers: 동시에 읽을 파일 수
+
+    Returns:
+        파일명 순으로 정렬된 {"path", "original_url", "title", "date"} 목록
     """
     try:
-        # 날짜 파싱
-        if post.get("published_date"):
-            date = post["published_date"]
-        else:
-            date = datetime.datetime.now()
-
-        # 파일명 생성 (안전하게)
-        safe_title = sanitize_filename(post["title"])
-        filename = f"{date.strftime('%Y-%m-%d')}-{safe_title}.md"
-        filepath = output_dir / filename
-
-        # 중복 방지
-        counter = 1
-        original_filepath = filepath
-        while filepath.exists():
-            filename = f"{date.strftime('%Y-%m-%d')}-{safe_title}-{counter}.md"
-            filepath = output_dir / filename
-            counter += 1
-            if counter > 100:  # 무한 루프 방지
-                logger.error(f"파일명 생성 실패: {post['title']}")
-                return None
-
-        # Jekyll front matter 생성
-        front_matter = f"""---
+        with os.scandir(directory) as entries:
+            paths = sorted(
+                Path(entry.path) for entry in entries if entry.name.endswith(".md")
+            )
+    except FileNotFoundError:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return [post for post in executor.map(_scan_post, paths) if post]
+
+
+class PostManifest:
+    """
+    원본 URL → 생성한 포스트 파일(경로, 내용 해시, 날짜) 목록
+
+    출력 저장소에 함께 커밋되어, 다음 실행에서 새 포스트만 만들고
+    내용이 바뀐 포스트는 같은 파일에 다시 쓰며 그대로인 포스트는 건드리지 않습니다.
+    키를 정렬해 저장하므로 목록 파일의 git diff도 바뀐 포스트 줄로 한정됩니다.
+
+    Args:
+        root: 출력 저장소 디렉토리 (경로는 이 디렉토리 기준 상대 경로로 저장)
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / POST_MANIFEST_FILE
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.stats = {"created": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        self.loaded = False
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == POST_MANIFEST_VERSION:
+                self.entries = data.get("posts", {})
+                self.loaded = True
+            else:
+                logger.warning("포스트 목록 형식이 달라 새로 만듭니다.")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"포스트 목록을 읽을 수 없어 새로 만듭니다: {e}")
+
+    def get(self, link: str) -> Optional[Dict[str, str]]:
+        return self.entries.get(link)
+
+    def record(
+        self, link: str, filepath: Path, digest: str, date: str, status: str
+    ) -> None:
+        """포스트 처리 결과를 기록합니다. (status: created/updated/unchanged)"""
+        self.stats[status] += 1
+        entry = {
+            "path": filepath.relative_to(self.root).as_posix(),
+            "hash": digest,
+            "date": date,
+        }
+        if self.entries.get(link) != entry:
+            self.entries[link] = entry
+            self._dirty = True
+
+    def rebuild(self, posts_dir: Path, workers: int = WRITE_WORKERS) -> int:
+        """
+        기존 포스트 파일의 front matter로 목록을 다시 만듭니다.
+
+        본문은 읽지 않으므로 내용 해시는 비워 두고, 다음에 같은 포스트를 만들 때
+        파일 내용과 비교하여 채웁니다. original_url이 같은 파일이 여럿이면
+        파일명 순으로 첫 번째 파일을 사용합니다.
+
+        Returns:
+            목록에 등록한 포스트 수
+        """
+        duplicates = 0
+        for post in scan_posts(posts_dir, workers):
+            link = post["original_url"]
+            if not link:
+                continue
+            if link in self.entries:
+                duplicates += 1
+                continue
+            date = post["date"] or datetime.datetime.now()
+            self.entries[link] = {
+                "path": post["path"].relative_to(self.root).as_posix(),
+                "hash": "",
+                "date": date.isoformat(),
+            }
+            self._dirty = True
+        if duplicates:
+            logger.warning(f"original_url이 중복된 포스트 파일 {duplicates}개는 무시합니다.")
+        return len(self.entries)
+
+    def remove(self, links: List[str]) -> List[str]:
+        """
+        목록에 있는 포스트 파일을 삭제합니다.
+
+        Returns:
+            삭제한 파일 경로 목록
+        """
+        removed = []
+        for link in links:
+            entry = self.entries.pop(link, None)
+            if entry is None:
+                continue
+            filepath = self.root / entry["path"]
+            try:
+                filepath.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"포스트 삭제 실패: {filepath}: {e}")
+                self.entries[link] = entry
+                continue
+            self.stats["removed"] += 1
+            self._dirty = True
+            removed.append(str(filepath))
+        return removed
+
+    def save(self, writer: Optional[AtomicWriter] = None) -> None:
+        """
+        변경된 경우에만 목록 파일을 저장합니다.
+
+        Args:
+            writer: 포스트 파일과 같은 묶음으로 저장할 작성기 (없으면 바로 저장)
+        """
+        if not self._dirty:
+            return
+        data = (
+            json.dumps(
+                {"version": POST_MANIFEST_VERSION, "posts": self.entries},
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n"
+        )
+        try:
+            if writer is not None:
+                writer.write(self.path, data)
+            else:
+                atomic_write(self.path, data)
+            self._dirty = False
+        except OSError as e:
+            logger.error(f"포스트 목록 저장 실패: {e}")
+
+
+class PostDirectoryIndex:
+    """
+    _posts 디렉토리의 파일명 색인
+
+    디렉토리를 한 번만 훑어 파일명을 메모리에 올려 두고, 한 번의 실행에서 하는
+    모든 파일명 할당과 존재 확인을 이 색인으로 처리합니다.
+    포스트마다 exists()를 여러 번 호출하던 충돌 확인을 대신합니다.
+
+    Args:
+        directory: 포스트 디렉토리
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        try:
+            with os.scandir(directory) as entries:
+                self.names: Set[str] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            self.names = set()
+        # 파일은 없어도 포스트 목록이 이미 쓰고 있는 이름 (새 포스트에 할당하지 않음)
+        self.reserved: Set[str] = set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def reserve(self, names: Iterable[str]) -> None:
+        """다른 포스트가 쓰는 파일명을 새 포스트에 할당하지 않도록 예약합니다."""
+        self.reserved.update(names)
+
+    def allocate(self, stem: str, link: str) -> Path:
+        """
+        새 포스트의 파일 경로를 정합니다.
+
+        이름이 겹치면 원본 링크 해시를 덧붙이므로, 같은 포스트는 처리 순서나
+        실행 횟수와 관계없이 항상 같은 파일명을 받습니다.
+
+        Args:
+            stem: 확장자를 뺀 기본 파일명 (날짜-제목)
+            link: 포스트 원본 링크
+        """
+        taken = self.names | self.reserved if self.reserved else self.names
+        filename = f"{stem}.md"
+        if filename in taken:
+            suffix = hashlib.sha256(link.encode("utf-8")).hexdigest()[:8]
+            filename = f"{stem}-{suffix}.md"
+            counter = 1
+            while filename in taken:
+                filename = f"{stem}-{suffix}-{counter}.md"
+                counter += 1
+        self.names.add(filename)
+        return self.directory / filename
+
+
+def render_jekyll_post(post: Dict[str, Any], date: datetime.datetime) -> str:
+    """
+    Jekyll 포스트 파일 내용(front matter + 본문)을 만듭니다.
+    같은 포스트는 항상 같은 내용이 되도록 실행 시각 등에 의존하지 않습니다.
+    """
+    # Jekyll front matter 생성 (JSON 문자열/배열은 그대로 YAML로 읽힘)
+    categories, tags = infer_taxonomy(post)
+    excerpt = json.dumps(post_excerpt(post), ensure_ascii=False)
+    front_matter = f"""---
 layout: post
 title: "{post["title"]}"
 date: {date.strftime("%Y-%m-%d %H:%M:%S %z")}
-categories: [IT, DevSecOps, 코딩]
-tags: []
+categories: {json.dumps(categories, ensure_ascii=False)}
+tags: {json.dumps(tags, ensure_ascii=False)}
+excerpt: {excerpt}
 comments: true
 original_url: {post["link"]}
 ---
 """
 
-        # 본문 생성
-        content = post.get("content", "")
-        if not content:
-            content = post.get("description", "")
+    # 본문 생성
+    content = post.get("content", "")
+    if not content:
+        content = post.get("description", "")
+
+    # 원본 링크 추가
+    content += f"\n\n원본 포스트: [{post['link']}]({post['link']})\n"
+    return front_matter + content
+
+
+def _post_date(
+    post: Dict[str, Any], entry: Optional[Dict[str, str]]
+) -> datetime.datetime:
+    """포스트 날짜 (날짜가 없는 포스트는 처음 만들 때의 날짜를 유지)"""
+    if post.get("published_date"):
+        return post["published_date"]
+    if entry:
+        return datetime.datetime.fromisoformat(entry["date"])
+    return datetime.datetime.now()
+
+
+def _render_post_task(
+    task: Tuple[Dict[str, Any], datetime.datetime]
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    포스트 하나를 렌더링합니다. (작업 프로세스에서 실행)
+
+    Returns:
+        (파일 내용, 내용 해시, None) 또는 실패 시 (None, None, 오류 메시지)
+    """
+    post, date = task
+    try:
+        text = render_jekyll_post(post, date)
+    except Exception as e:
+        return None, None, f"렌더링 실패: {e}"
+    return text, hashlib.sha256(text.encode("utf-8")).hexdigest(), None
+
+
+def _file_hash(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _manifest_names(manifest: PostManifest) -> Iterable[str]:
+    """포스트 목록에 등록된 파일명 (처리 순서와 관계없이 미리 예약하기 위함)"""
+    return (PurePosixPath(entry["path"]).name for entry in manifest.entries.values())
+
+
+def _plan_post(
+    post: Dict[str, Any],
+    date: datetime.datetime,
+    digest: str,
+    manifest: Optional[PostManifest],
+    index: PostDirectoryIndex,
+) -> Tuple[Path, str]:
+    """
+    포스트를 쓸 경로와 처리 방법을 정합니다.
+    파일명 충돌을 피하려면 모든 포스트가 같은 색인을 거쳐 차례로 호출해야 합니다.
+
+    Returns:
+        (파일 경로, 상태). 상태는 created/updated/unchanged
+    """
+    entry = manifest.get(post["link"]) if manifest else None
+    if entry:
+        filepath = manifest.root / entry["path"]
+        if filepath.name not in index:
+            # 파일이 지워졌어도 이 포스트가 다시 쓸 이름이므로 새 포스트에 할당되지 않게 예약
+            index.names.add(filepath.name)
+        else:
+            # front matter만 읽어 등록한 포스트는 처음 한 번 파일 내용과 비교
+            known = entry["hash"] or _file_hash(filepath)
+            if known == digest:
+                return filepath, "unchanged"
+        return filepath, "updated"
+
+    # 파일명 생성 (안전하게, 중복 방지)
+    safe_title = sanitize_filename(post["title"])
+    filepath = index.allocate(f"{date.strftime('%Y-%m-%d')}-{safe_title}", post["link"])
+    return filepath, "created"
+
+
+def create_jekyll_post(
+    post: Dict[str, Any],
+    output_dir: Path,
+    manifest: Optional[PostManifest] = None,
+    index: Optional[PostDirectoryIndex] = None,
+) -> Optional[str]:
+    """
+    Jekyll 포스트 파일을 생성합니다.
+    포스트 목록(manifest)이 있으면 이미 만든 포스트는 내용이 바뀐 경우에만
+    같은 파일에 다시 씁니다. 여러 포스트는 write_jekyll_posts()로 한 번에 만듭니다.
+
+    Args:
+        post: 포스트 정보 딕셔너리
+        output_dir: 출력 디렉토리
+        manifest: 이전 실행에서 만든 포스트 목록
+        index: 출력 디렉토리 파일명 색인 (여러 포스트를 만들 때는 하나를 공유하고,
+            포스트 목록의 파일명은 호출한 쪽에서 reserve()로 예약)
 
-        # 원본 링크 추가
-        content += f"\n\n원본 포스트: [{post['link']}]({post['link']})\n"
+    Returns:
+        생성(또는 유지)된 파일 경로 또는 None
+    """
+    try:
+        if index is None:
+            index = PostDirectoryIndex(output_dir)
+            if manifest is not None:
+                index.reserve(_manifest_names(manifest))
+        date = _post_date(post, manifest.get(post["link"]) if manifest else None)
+        text = render_jekyll_post(post, date)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        filepath, status = _plan_post(post, date, digest, manifest, index)
 
         # 파일 작성
-        filepath.write_text(front_matter + content, encoding="utf-8")
-        logger.info(f"포스트 생성 완료: {filename}")
+        if status != "unchanged":
+            atomic_write(filepath, text)
+        if manifest is not None:
+            manifest.record(post["link"], filepath, digest, date.isoformat(), status)
+        if status == "created":
+            logger.info(f"포스트 생성 완료: {filepath.name}")
+        elif status == "updated":
+            logger.info(f"포스트 갱신 완료: {filepath.name}")
         return str(filepath)
 
     except Exception as e:
@@ -535,12 +1979,162 @@ original_url: {post["link"]}
         return None
 
 
+def write_jekyll_posts(
+    posts: List[Dict[str, Any]],
+    output_dir: Path,
+    manifest: Optional[PostManifest] = None,
+    index: Optional[PostDirectoryIndex] = None,
+    render_workers: int = RENDER_WORKERS,
+    write_workers: int = WRITE_WORKERS,
+    writer: Optional[AtomicWriter] = None,
+) -> Dict[str, Any]:
+    """
+    여러 포스트를 렌더링 → 파일명 결정 → 쓰기 단계로 나누어 생성합니다.
+
+    렌더링(front matter, 본문, 해시)은 프로세스 풀에서 코어 수만큼 병렬로,
+    파일명 결정은 충돌이 없도록 한 곳에서 순서대로, 파일 쓰기는 크기가 정해진
+    스레드 풀에서 원자적으로 처리합니다. 포스트별 오류는 로그만 남기지 않고 요약에 모읍니다.
+
+    Args:
+        posts: 포스트 목록
+        output_dir: 출력 디렉토리
+        manifest: 이전 실행에서 만든 포스트 목록
+        index: 출력 디렉토리 파일명 색인
+        render_workers: 렌더링 프로세스 수 (1이면 현재 프로세스에서 렌더링)
+        write_workers: 파일 쓰기 스레드 수
+        writer: 파일을 쓸 작성기 (없으면 새 묶음을 만들어 마지막에 확정)
+
+    Returns:
+        {"written": 새로 쓴 파일 경로 목록, "unchanged": 그대로 둔 포스트 수,
+         "errors": (원본 링크, 오류 메시지) 목록}
+    """
+    if index is None:
+        index = PostDirectoryIndex(output_dir)
+    if manifest is not None:
+        index.reserve(_manifest_names(manifest))
+    tasks = [
+        (post, _post_date(post, manifest.get(post["link"]) if manifest else None))
+        for post in posts
+    ]
+
+    # 1) 렌더링: 포스트가 적으면 프로세스 시작 비용이 더 크므로 직접 처리
+    if render_workers > 1 and len(tasks) >= PARALLEL_RENDER_MIN_POSTS:
+        chunksize = max(1, len(tasks) // (render_workers * 4))
+        with ProcessPoolExecutor(max_workers=render_workers) as executor:
+            rendered = list(
+                executor.map(_render_post_task, tasks, chunksize=chunksize)
+            )
+    else:
+        rendered = [_render_post_task(task) for task in tasks]
+
+    # 2) 파일명 결정
+    summary: Dict[str, Any] = {"written": [], "unchanged": 0, "errors": []}
+    writes = []
+    for (post, date), (text, digest, error) in zip(tasks, rendered):
+        if error:
+            summary["errors"].append((post["link"], error))
+            continue
+        filepath, status = _plan_post(post, date, digest, manifest, index)
+        if status == "unchanged":
+            summary["unchanged"] += 1
+            if manifest is not None:
+                manifest.record(
+                    post["link"], filepath, digest, date.isoformat(), status
+                )
+            continue
+        writes.append((post, date, filepath, text, digest, status))
+
+    # 3) 파일 쓰기
+    batch = writer or AtomicWriter()
+    with ThreadPoolExecutor(max_workers=max(1, write_workers)) as executor:
+        futures = [
+            executor.submit(batch.write, filepath, text)
+            for _, _, filepath, text, _, _ in writes
+        ]
+        for (post, date, filepath, _, digest, status), future in zip(
+            writes, futures
+        ):
+            try:
+                future.result()
+            except OSError as e:
+                summary["errors"].append((post["link"], f"쓰기 실패: {e}"))
+                continue
+            if manifest is not None:
+                manifest.record(
+                    post["link"], filepath, digest, date.isoformat(), status
+                )
+            summary["written"].append(str(filepath))
+            if status == "created":
+                logger.info(f"포스트 생성 완료: {filepath.name}")
+            else:
+                logger.info(f"포스트 갱신 완료: {filepath.name}")
+    if writer is None:
+        batch.commit()
+    return summary
+
+
+def write_if_changed(
+    path: Path, content: str, writer: Optional[AtomicWriter] = None
+) -> bool:
+    """
+    디스크의 내용과 다를 때만 파일을 원자적으로 씁니다.
+    같은 내용이면 파일을 건드리지 않으므로 수정 시각도 그대로 유지됩니다.
+
+    Args:
+        path: 파일 경로
+        content: 파일 내용
+        writer: 파일을 쓸 작성기 (없으면 바로 씀)
+
+    Returns:
+        파일을 썼으면 True
+    """
+    data = content.encode("utf-8")
+    try:
+        # 크기가 다르면 내용을 읽지 않고 바로 씀
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if writer is not None:
+        writer.write(path, data)
+    else:
+        atomic_write(path, data)
+    return True
+
+
+def write_scaffold(output_dir: Path, files: Dict[str, str]) -> List[str]:
+    """
+    렌더링한 뼈대 파일들을 바뀐 것만 씁니다.
+
+    Args:
+        output_dir: 출력 디렉토리
+        files: 출력 디렉토리 기준 상대 경로 → 파일 내용
+
+    Returns:
+        새로 쓰거나 바뀐 파일의 상대 경로 목록
+    """
+    touched = []
+    with AtomicWriter() as writer:
+        for name, content in files.items():
+            if write_if_changed(output_dir / name, content, writer):
+                touched.append(name)
+                logger.info(f"  → {name} 갱신")
+    return touched
+
+
 def create_jekyll_structure(
     output_dir: Path, repo_name: str, github_username: str
-) -> None:
+) -> List[str]:
     """
     Jekyll 블로그 기본 구조를 생성합니다.
+    내용이 바뀐 파일만 다시 쓰므로 변경이 없으면 파일과 수정 시각이 그대로 남습니다.
+
+    Returns:
+        새로 쓰거나 바뀐 파일의 상대 경로 목록
     """
+    files: Dict[str, str] = {}
+
     # 디렉토리 생성
     (output_dir / "_posts").mkdir(parents=True, exist_ok=True)
     (output_dir / "_layouts").mkdir(parents=True, exist_ok=True)
@@ -592,7 +2186,7 @@ exclude:
   - .git
   - .gitignore
 """
-    (output_dir / "_config.yml").write_text(config_content, encoding="utf-8")
+    files["_config.yml"] = config_content
 
     # index.html 생성
     index_content = """---
@@ -621,7 +2215,7 @@ layout: default
   <p class="rss-subscribe">subscribe <a href="{{ "/feed.xml" | relative_url }}">via RSS</a></p>
 </div>
 """
-    (output_dir / "index.html").write_text(index_content, encoding="utf-8")
+    files["index.html"] = index_content
 
     # post.html 레이아웃 생성 (giscus 포함)
     post_layout = """---
@@ -664,7 +2258,7 @@ layout: default
   <a class="u-url" href="{{ page.url | relative_url }}" hidden></a>
 </article>
 """
-    (output_dir / "_layouts" / "post.html").write_text(post_layout, encoding="utf-8")
+    files["_layouts/post.html"] = post_layout
 
     # default.html 레이아웃 생성
     default_layout = """<!DOCTYPE html>
@@ -705,9 +2299,7 @@ layout: default
   </body>
 </html>
 """
-    (output_dir / "_layouts" / "default.html").write_text(
-        default_layout, encoding="utf-8"
-    )
+    files["_layouts/default.html"] = default_layout
 
     # README.md 생성
     readme_content = f"""# {github_username}'s Tech Blog
@@ -738,7 +2330,7 @@ bundle exec jekyll serve
 
 GitHub Actions를 통해 자동으로 배포됩니다.
 """
-    (output_dir / "README.md").write_text(readme_content, encoding="utf-8")
+    files["README.md"] = readme_content
 
     # .gitignore 생성
     gitignore_content = """_site/
@@ -749,7 +2341,7 @@ vendor/
 .bundle/
 Gemfile.lock
 """
-    (output_dir / ".gitignore").write_text(gitignore_content, encoding="utf-8")
+    files[".gitignore"] = gitignore_content
 
     # Gemfile 생성
     gemfile_content = """source "https://rubygems.org"
@@ -764,9 +2356,11 @@ group :jekyll_plugins do
   gem "jekyll-sitemap", "~> 1.4"
 end
 """
-    (output_dir / "Gemfile").write_text(gemfile_content, encoding="utf-8")
+    files["Gemfile"] = gemfile_content
 
-    logger.info("Jekyll 블로그 구조 생성 완료")
+    touched = write_scaffold(output_dir, files)
+    logger.info(f"Jekyll 블로그 구조 생성 완료 (변경된 파일 {len(touched)}개)")
+    return touched
 
 
 def create_github_repo(owner: str, repo_name: str, description: str) -> bool:
@@ -805,9 +2399,12 @@ def create_github_repo(owner: str, repo_name: str, description: str) -> bool:
         return False
 
 
-def create_github_actions_workflow(output_dir: Path) -> None:
+def create_github_actions_workflow(output_dir: Path) -> List[str]:
     """
-    GitHub Actions 워크플로우를 생성합니다.
+    GitHub Actions 워크플로우를 생성합니다. (내용이 바뀐 경우에만 씀)
+
+    Returns:
+        새로 쓰거나 바뀐 파일의 상대 경로 목록
     """
     workflow_dir = output_dir / ".github" / "workflows"
     workflow_dir.mkdir(parents=True, exist_ok=True)
@@ -866,8 +2463,11 @@ jobs:
         id: deployment
         uses: actions/deploy-pages@v4
 """
-    (workflow_dir / "jekyll.yml").write_text(workflow_content, encoding="utf-8")
-    logger.info("GitHub Actions 워크플로우 생성 완료")
+    touched = write_scaffold(
+        output_dir, {".github/workflows/jekyll.yml": workflow_content}
+    )
+    logger.info(f"GitHub Actions 워크플로우 생성 완료 (변경된 파일 {len(touched)}개)")
+    return touched
 
 
 def main():
@@ -879,6 +2479,95 @@ def main():
     )
     parser.add_argument("--repo-name", default="tech-blog", help="GitHub 저장소 이름")
     parser.add_argument("--username", default="Twodragon0", help="GitHub 사용자명")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_FETCH_WORKERS,
+        help="동시에 진행할 최대 HTTP 요청 수 (1이면 순차 수집)",
+    )
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="ETag/Last-Modified 조건부 요청 캐시를 사용하지 않음",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=COLLECT_DEADLINE,
+        help="수집 단계 전체 시간 예산 (초, 0이면 제한 없음)",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=CONNECT_TIMEOUT,
+        help="호스트 연결 타임아웃 (초)",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=REQUEST_TIMEOUT,
+        help="응답 읽기 타임아웃 (초)",
+    )
+    parser.add_argument(
+        "--full-resync",
+        action="store_true",
+        help="WordPress 증분 동기화 기준을 무시하고 전체 포스트를 다시 수집",
+    )
+    parser.add_argument(
+        "--detect-deletions",
+        action="store_true",
+        help="WordPress에서 삭제된 포스트를 확인 (ID 목록을 추가로 요청)",
+    )
+    parser.add_argument(
+        "--no-classification-cache",
+        action="store_true",
+        help="이전 실행의 포스트 분류 결과를 재사용하지 않음",
+    )
+    parser.add_argument(
+        "--filter-report",
+        default=FILTER_REPORT_FILE,
+        metavar="FILE",
+        help=f"키워드 필터 통계 JSON 보고서 경로 (기본: {FILTER_REPORT_FILE})",
+    )
+    parser.add_argument(
+        "--tech-threshold",
+        type=float,
+        default=TECH_SCORE_THRESHOLD,
+        help=f"기술 관련 포스트로 판단할 최소 관련도 점수 (기본: {TECH_SCORE_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=RENDER_WORKERS,
+        help="포스트 렌더링 프로세스 수 (1이면 순차 렌더링)",
+    )
+    parser.add_argument(
+        "--write-workers",
+        type=int,
+        default=WRITE_WORKERS,
+        help="포스트 파일 쓰기 스레드 수",
+    )
+    parser.add_argument(
+        "--prune-deleted",
+        action="store_true",
+        help="원본에서 삭제된 포스트의 파일도 삭제 (--detect-deletions와 함께 사용)",
+    )
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument(
+        "--record",
+        metavar="DIR",
+        help="수집 중 모든 HTTP 응답을 DIR에 기록 (오프라인 재현용)",
+    )
+    archive_group.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="네트워크 대신 DIR에 기록된 HTTP 응답으로 수집",
+    )
+    parser.add_argument(
+        "--replay-realtime",
+        action="store_true",
+        help="재생 시 기록된 응답 시간만큼 기다림 (지연 재현)",
+    )
     args = parser.parse_args()
 
     # 수집할 블로그 URL 목록
@@ -890,22 +2579,39 @@ def main():
     ]
     github_username = args.username
     repo_name = args.repo_name
+    KEYWORD_SCORER.threshold = args.tech_threshold
 
     logger.info("=" * 60)
     logger.info("멀티 블로그 → GitHub 블로그 변환 시작")
     logger.info("=" * 60)
 
+    # 수집(증분 동기화 상태 갱신) 전에 출력 디렉토리를 쓸 수 있는지 확인
+    output_dir = Path(f"./{repo_name}")
+    if output_dir.exists() and not args.overwrite:
+        logger.error(f"출력 디렉토리가 이미 존재합니다: {output_dir}")
+        logger.error("덮어쓰려면 --overwrite 또는 -y 옵션을 사용하세요.")
+        sys.exit(1)
+
     # 1. 포스트 수집 및 필터링
     logger.info("1단계: 여러 블로그에서 포스트 수집 및 필터링")
-    all_posts = []
-    for blog_url in blog_urls:
-        logger.info(f"블로그 수집 중: {blog_url}")
-        posts = fetch_blog_posts(blog_url)
-        if posts:
-            logger.info(f"  → {len(posts)}개의 기술 관련 포스트 수집")
-            all_posts.extend(posts)
-        else:
-            logger.warning(f"  → 수집된 포스트 없음")
+    logger.info(f"블로그 수집 중: {len(blog_urls)}개 (동시 {args.workers}개)")
+    # 출력 디렉토리에 포스트가 없으면 증분 동기화 결과만으로는 부족하므로 전체 수집
+    full_resync = args.full_resync or not (output_dir / "_posts").exists()
+    all_posts, sync_state = collect_blog_posts(
+        blog_urls,
+        workers=args.workers,
+        use_cache=not args.no_http_cache,
+        full_resync=full_resync,
+        detect_deletions=args.detect_deletions,
+        deadline=args.deadline or None,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        record_dir=args.record,
+        replay_dir=args.replay,
+        replay_realtime=args.replay_realtime,
+        use_classification_cache=not args.no_classification_cache,
+        filter_report=args.filter_report,
+    )
 
     if not all_posts:
         logger.error("수집된 포스트가 없습니다.")
@@ -920,32 +2626,58 @@ def main():
     posts = list(unique_posts.values())
     logger.info(f"총 {len(posts)}개의 유니크한 기술 관련 포스트를 찾았습니다.")
 
-    # 2. 출력 디렉토리 생성
-    output_dir = Path(f"./{repo_name}")
-    if output_dir.exists() and not args.overwrite:
-        logger.error(f"출력 디렉토리가 이미 존재합니다: {output_dir}")
-        logger.error("덮어쓰려면 --overwrite 또는 -y 옵션을 사용하세요.")
-        sys.exit(1)
-
-    # 3. Jekyll 구조 생성
+    # 2. Jekyll 구조 생성
     logger.info("2단계: Jekyll 블로그 구조 생성")
     create_jekyll_structure(output_dir, repo_name, github_username)
 
-    # 4. 포스트 생성
+    # 3. 포스트 생성
     logger.info("3단계: 포스트 파일 생성")
     posts_dir = output_dir / "_posts"
-    created_count = 0
-    for post in posts:
-        if create_jekyll_post(post, posts_dir):
-            created_count += 1
-
-    logger.info(f"{created_count}개의 포스트 파일 생성 완료")
-
-    # 5. GitHub Actions 워크플로우 생성
+    manifest = PostManifest(output_dir)
+    if not manifest.loaded and posts_dir.exists():
+        # 이전에 만들었거나 직접 편집한 저장소: 기존 포스트를 목록에 등록해 중복 생성 방지
+        adopted = manifest.rebuild(posts_dir, workers=args.write_workers)
+        logger.info(f"기존 포스트 {adopted}개를 포스트 목록에 등록했습니다.")
+    # 포스트 파일과 포스트 목록을 한 묶음으로 확정
+    with AtomicWriter() as writer:
+        summary = write_jekyll_posts(
+            posts,
+            posts_dir,
+            manifest,
+            render_workers=args.render_workers,
+            write_workers=args.write_workers,
+            writer=writer,
+        )
+        if args.prune_deleted:
+            deleted_links = [
+                link for links in sync_state.deleted.values() for link in links
+            ]
+            for filepath in manifest.remove(deleted_links):
+                logger.info(f"삭제된 포스트 파일 제거: {filepath}")
+        manifest.save(writer)
+
+    stats = manifest.stats
+    logger.info(
+        f"포스트 파일: 생성 {stats['created']}개, 갱신 {stats['updated']}개, "
+        f"변경 없음 {stats['unchanged']}개, 삭제 {stats['removed']}개"
+    )
+    if summary["errors"]:
+        logger.warning(f"{len(summary['errors'])}개 포스트 생성 실패:")
+        for link, error in summary["errors"]:
+            logger.warning(f"  → {link}: {error}")
+
+    # 포스트가 모두 기록된 뒤에 증분 동기화 기준을 올림.
+    # 쓰기에 실패한 포스트가 있는 블로그는 다음 실행에서 다시 받도록 기준을 유지
+    failed_links = [link for link, _ in summary["errors"]]
+    for blog_url in sync_state.revert(failed_links):
+        logger.warning(f"  → {blog_url}: 실패한 포스트가 있어 동기화 기준을 유지합니다.")
+    sync_state.save()
+
+    # 4. GitHub Actions 워크플로우 생성
     logger.info("4단계: GitHub Actions 워크플로우 생성")
     create_github_actions_workflow(output_dir)
 
-    # 6. GitHub 저장소 생성
+    # 5. GitHub 저장소 생성
     logger.info("5단계: GitHub 저장소 생성")
     description = "IT, DevSecOps, 코딩 관련 기술 블로그"
     if create_github_repo(github_username, repo_name, description):